@@ -1,6 +1,6 @@
 from flask import Flask
-from os import getenv
-from app.configs import database, migrations, auth, cors
+from os import getenv, path
+from app.configs import database, migrations, auth, cors, storage, cache, security, blocklist, log
 from app import routes
 from app import exceptions
 from dotenv import load_dotenv
@@ -14,14 +14,67 @@ def create_app():
 
     app.config["SQLALCHEMY_DATABASE_URI"] = getenv("SQLALCHEMY_DATABASE_URI")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_RECORD_QUERIES"] = getenv(
+        "SQLALCHEMY_RECORD_QUERIES", "false").lower() == "true"
+    app.config["LOG_LEVEL"] = getenv("LOG_LEVEL", "INFO").upper()
+    app.config["DATABASE_POOL_SIZE"] = int(getenv("DATABASE_POOL_SIZE", 5))
+    app.config["DATABASE_MAX_OVERFLOW"] = int(
+        getenv("DATABASE_MAX_OVERFLOW", 10))
+    app.config["DATABASE_POOL_TIMEOUT"] = int(
+        getenv("DATABASE_POOL_TIMEOUT", 30))
+    app.config["DATABASE_POOL_RECYCLE"] = int(
+        getenv("DATABASE_POOL_RECYCLE", 1800))
+    app.config["DATABASE_POOL_PRE_PING"] = getenv(
+        "DATABASE_POOL_PRE_PING", "true").lower() == "true"
+    app.config["DATABASE_STATEMENT_TIMEOUT"] = int(
+        getenv("DATABASE_STATEMENT_TIMEOUT", 0))
+    app.config["DATABASE_REPLICA_URIS"] = [
+        uri for uri in getenv("DATABASE_REPLICA_URIS", "").split(",") if uri]
+    app.config["DATABASE_REPLICA_STICKY_SECONDS"] = int(
+        getenv("DATABASE_REPLICA_STICKY_SECONDS", 10))
+    app.config["DATABASE_REPLICA_PIN_BACKEND"] = getenv(
+        "DATABASE_REPLICA_PIN_BACKEND", "local")
+    app.config["DATABASE_REPLICA_PIN_URL"] = getenv("DATABASE_REPLICA_PIN_URL")
+    app.config["DATABASE_REPLICA_PIN_SIZE"] = int(
+        getenv("DATABASE_REPLICA_PIN_SIZE", 100000))
     app.config["JSON_SORT_KEYS"] = False
     app.config["MAX_CONTENT_LENGTH"] = 1 * 1024 * 1024
     app.config["SECRET_KEY"] = getenv("SECRET_KEY")
+    app.config["PASSWORD_HASH_METHOD"] = getenv(
+        "PASSWORD_HASH_METHOD", "pbkdf2:sha256:260000")
+    app.config["PASSWORD_SALT_LENGTH"] = int(getenv("PASSWORD_SALT_LENGTH", 16))
+    app.config["PASSWORD_HASH_WORKERS"] = int(getenv("PASSWORD_HASH_WORKERS", 0))
+    app.config["TOKEN_BLOCKLIST_BACKEND"] = getenv(
+        "TOKEN_BLOCKLIST_BACKEND", "local")
+    app.config["TOKEN_BLOCKLIST_SIZE"] = int(
+        getenv("TOKEN_BLOCKLIST_SIZE", 100000))
+    app.config["DEFAULT_PAGE_SIZE"] = int(getenv("DEFAULT_PAGE_SIZE", 20))
+    app.config["MAX_PAGE_SIZE"] = int(getenv("MAX_PAGE_SIZE", 100))
+    app.config["STREAM_BATCH_SIZE"] = int(getenv("STREAM_BATCH_SIZE", 500))
+    app.config["CATALOG_TRIGRAM_SEARCH"] = getenv(
+        "CATALOG_TRIGRAM_SEARCH", "false").lower() == "true"
+    app.config["CATALOG_CACHE_SIZE"] = int(getenv("CATALOG_CACHE_SIZE", 1024))
+    app.config["CATALOG_CACHE_TTL"] = int(getenv("CATALOG_CACHE_TTL", 600))
+    app.config["PROFESSIONAL_CACHE_BACKEND"] = getenv(
+        "PROFESSIONAL_CACHE_BACKEND", "local")
+    app.config["PROFESSIONAL_CACHE_URL"] = getenv("PROFESSIONAL_CACHE_URL")
+    app.config["PROFESSIONAL_CACHE_SIZE"] = int(
+        getenv("PROFESSIONAL_CACHE_SIZE", 1024))
+    app.config["PROFESSIONAL_CACHE_TTL"] = int(
+        getenv("PROFESSIONAL_CACHE_TTL", 60))
+    app.config["BLOB_STORAGE_BACKEND"] = getenv("BLOB_STORAGE_BACKEND", "local")
+    app.config["BLOB_STORAGE_PATH"] = getenv(
+        "BLOB_STORAGE_PATH") or path.join(app.instance_path, "blobs")
 
+    log.init_app(app)
     cors.init_app(app)
     database.init_app(app)
+    storage.init_app(app)
+    cache.init_app(app)
     migrations.init_app(app)
+    blocklist.init_app(app)
     auth.init_app(app)
+    security.init_app(app)
     routes.init_app(app)
     exceptions.init_app(app)
 
@@ -1,6 +1,55 @@
-from flask import Flask
-from flask_jwt_extended import JWTManager
+from flask import Flask, current_app, g
+from flask_jwt_extended import JWTManager, create_access_token, get_jwt, get_jwt_identity
+from app.exceptions.login_exceptions import RoleNotAllowedError
+from app.configs.database import read_from_primary
+
+
+TOKEN_VERSION = 1
+
+
+def create_user_token(user):
+    read_from_primary(f"{user.role}:{user.id}")
+
+    return create_access_token(
+        identity=user.id,
+        additional_claims={"role": user.role, "ver": TOKEN_VERSION}
+    )
+
+
+def revoke_current_token():
+    token = get_jwt()
+    current_app.blocklist.add(token["jti"], token["exp"])
+
+
+def get_current_user(role=None):
+    if role and get_jwt()["role"] != role:
+        raise RoleNotAllowedError(role)
+
+    if "current_user" not in g:
+        from app.models.client_model import ClientModel
+        from app.models.professional_model import ProfessionalModel
+
+        models = {
+            ClientModel.role: ClientModel,
+            ProfessionalModel.role: ProfessionalModel
+        }
+
+        g.current_user = models[get_jwt()["role"]].query.get(get_jwt_identity())
+
+    return g.current_user
 
 
 def init_app(app: Flask):
-    JWTManager(app)
+    jwt = JWTManager(app)
+
+    @jwt.token_in_blocklist_loader
+    def check_token_revoked(jwt_header, jwt_data):
+        return current_app.blocklist.contains(jwt_data["jti"])
+
+    @jwt.token_verification_loader
+    def check_token_version(jwt_header, jwt_data):
+        return jwt_data.get("ver") == TOKEN_VERSION
+
+    @app.before_request
+    def reset_current_user():
+        g.pop("current_user", None)
@@ -0,0 +1,66 @@
+from flask import Flask
+from abc import ABC, abstractmethod
+from datetime import datetime
+from time import time
+from logging import getLogger
+from app.configs.cache import TTLCache
+from app.configs.database import db
+
+
+class TokenBlocklist(ABC):
+
+    @abstractmethod
+    def add(self, jti: str, expires_at: int):
+        ...
+
+    @abstractmethod
+    def contains(self, jti: str) -> bool:
+        ...
+
+
+class LocalTokenBlocklist(TokenBlocklist):
+
+    def __init__(self, maxsize: int):
+        self.tokens = TTLCache(maxsize, 0)
+
+    def add(self, jti: str, expires_at: int):
+        self.tokens.set(jti, True, max(expires_at - time(), 0))
+
+    def contains(self, jti: str) -> bool:
+        return self.tokens.get(jti, False)
+
+
+class DatabaseTokenBlocklist(TokenBlocklist):
+
+    def add(self, jti: str, expires_at: int):
+        from app.models.token_blocklist_model import TokenBlocklistModel
+
+        TokenBlocklistModel.query.filter(
+            TokenBlocklistModel.expires_at < datetime.utcnow()).delete()
+        db.session.merge(TokenBlocklistModel(
+            jti=jti, expires_at=datetime.utcfromtimestamp(expires_at)))
+        db.session.commit()
+
+    def contains(self, jti: str) -> bool:
+        from app.models.token_blocklist_model import TokenBlocklistModel
+
+        return db.session.query(
+            TokenBlocklistModel.query.filter_by(jti=jti).exists()
+        ).scalar()
+
+
+logger = getLogger(__name__)
+
+backends = {
+    "local": lambda app: LocalTokenBlocklist(app.config["TOKEN_BLOCKLIST_SIZE"]),
+    "database": lambda app: DatabaseTokenBlocklist()
+}
+
+
+def init_app(app: Flask):
+    app.blocklist = backends[app.config["TOKEN_BLOCKLIST_BACKEND"]](app)
+
+    if app.config["TOKEN_BLOCKLIST_BACKEND"] == "local":
+        logger.warning("revoked tokens are kept per worker and only the latest "
+                       "TOKEN_BLOCKLIST_SIZE of them, set "
+                       "TOKEN_BLOCKLIST_BACKEND=database to share them")
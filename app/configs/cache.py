@@ -0,0 +1,176 @@
+from flask import Flask, json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+
+
+class TTLCache:
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None or item[1] < monotonic():
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._items[key] = (value, monotonic() + (self.ttl if ttl is None else ttl))
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl
+        }
+
+
+class CacheBackend(ABC):
+
+    @abstractmethod
+    def get(self, key: str):
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value, ttl: float):
+        ...
+
+    @abstractmethod
+    def generation(self, namespace: str) -> int:
+        ...
+
+    @abstractmethod
+    def incr(self, namespace: str):
+        ...
+
+
+class LocalCacheBackend(CacheBackend):
+
+    def __init__(self, maxsize: int):
+        self.items = TTLCache(maxsize, 0)
+        self.generations = {}
+        self._lock = Lock()
+
+    def get(self, key: str):
+        return self.items.get(key)
+
+    def set(self, key: str, value, ttl: float):
+        self.items.set(key, value, ttl)
+
+    def generation(self, namespace: str) -> int:
+        return self.generations.get(namespace, 0)
+
+    def incr(self, namespace: str):
+        with self._lock:
+            self.generations[namespace] = self.generations.get(namespace, 0) + 1
+
+
+class RedisCacheBackend(CacheBackend):
+
+    def __init__(self, url: str):
+        from redis import Redis
+
+        self.client = Redis.from_url(url)
+
+    def get(self, key: str):
+        value = self.client.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value, ttl: float):
+        self.client.set(key, json.dumps(value), ex=int(ttl))
+
+    def generation(self, namespace: str) -> int:
+        return int(self.client.get(f"generation:{namespace}") or 0)
+
+    def incr(self, namespace: str):
+        self.client.incr(f"generation:{namespace}")
+
+
+class ReadThroughCache:
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self._loading = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def _key_lock(self, key):
+        with self._lock:
+            lock, waiting = self._loading.get(key, (Lock(), 0))
+            self._loading[key] = (lock, waiting + 1)
+
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiting = self._loading.pop(key)
+                if waiting > 1:
+                    self._loading[key] = (lock, waiting - 1)
+
+    def get_or_load(self, namespace: str, key: str, loader):
+        key = f"{namespace}:{self.backend.generation(namespace)}:{key}"
+        value = self.backend.get(key)
+
+        if value is not None:
+            return value
+
+        with self._key_lock(key):
+            value = self.backend.get(key)
+
+            if value is None:
+                value = loader()
+
+                if value is not None:
+                    self.backend.set(key, value, self.ttl)
+
+        return value
+
+    def invalidate(self, namespace: str):
+        self.backend.incr(namespace)
+
+
+backends = {
+    "local": lambda app: LocalCacheBackend(app.config["PROFESSIONAL_CACHE_SIZE"]),
+    "redis": lambda app: RedisCacheBackend(app.config["PROFESSIONAL_CACHE_URL"])
+}
+
+
+def init_app(app: Flask):
+    app.catalog_cache = TTLCache(
+        app.config["CATALOG_CACHE_SIZE"], app.config["CATALOG_CACHE_TTL"])
+    app.professional_cache = ReadThroughCache(
+        backends[app.config["PROFESSIONAL_CACHE_BACKEND"]](app),
+        app.config["PROFESSIONAL_CACHE_TTL"])
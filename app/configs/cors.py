@@ -3,4 +3,4 @@ from flask_cors import CORS
 
 
 def init_app(app: Flask):
-    CORS(app)
\ No newline at end of file
+    CORS(app, expose_headers=['X-Next-Cursor', 'X-Request-ID', 'ETag'])
\ No newline at end of file
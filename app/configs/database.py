@@ -1,10 +1,252 @@
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
+from flask import Flask, current_app, g, has_request_context, request
+from flask_sqlalchemy import SQLAlchemy, SignallingSession, get_debug_queries, get_state
+from flask_jwt_extended import get_jwt
+from sqlalchemy import event, orm
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+from threading import Lock, local
+from time import perf_counter
+from random import choice
+from contextlib import contextmanager
+from logging import getLogger
+from app.configs.cache import LocalCacheBackend, RedisCacheBackend
 
 
-db = SQLAlchemy()
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+logger = getLogger(__name__)
+
+pin_backends = {
+    "local": lambda app: LocalCacheBackend(app.config["DATABASE_REPLICA_PIN_SIZE"]),
+    "redis": lambda app: RedisCacheBackend(app.config["DATABASE_REPLICA_PIN_URL"])
+}
+
+
+def current_identity():
+    try:
+        token = get_jwt()
+    except RuntimeError:
+        return None
+
+    return f"{token['role']}:{token['sub']}" if token else None
+
+
+def read_from_primary(identity: str):
+    if current_app.config["DATABASE_REPLICA_BINDS"]:
+        current_app.replica_pins.set(
+            f"primary:{identity}", True, current_app.config["DATABASE_REPLICA_STICKY_SECONDS"])
+
+
+def replica_bind():
+    replicas = current_app.config["DATABASE_REPLICA_BINDS"]
+
+    if not replicas or request.method not in READ_METHODS or g.get("read_primary"):
+        return None
+
+    identity = current_identity()
+
+    if identity:
+        if "sticky_primary" not in g:
+            g.sticky_primary = current_app.replica_pins.get(
+                f"primary:{identity}") is not None
+        if g.sticky_primary:
+            return None
+
+    if "replica_bind" not in g:
+        g.replica_bind = choice(replicas)
+
+    return g.replica_bind
+
+
+@contextmanager
+def primary_reads():
+    previous = g.get("read_primary")
+    g.read_primary = True
+
+    try:
+        yield
+    finally:
+        g.read_primary = previous
+
+
+class RoutingSession(SignallingSession):
+
+    def get_bind(self, mapper=None, clause=None):
+        if not self._flushing and has_request_context() and not (
+                mapper is not None and getattr(mapper.class_, "primary_only", False)):
+            bind = replica_bind()
+
+            if bind:
+                return get_state(self.app).db.get_engine(self.app, bind=bind)
+
+        return super().get_bind(mapper, clause)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def track_flush(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def track_bulk_write(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def forget_write(session):
+    session.info.pop("wrote", None)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def stick_to_primary(session):
+    if session.info.pop("wrote", None) and has_request_context():
+        g.read_primary = True
+        identity = current_identity()
+
+        if identity:
+            read_from_primary(identity)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+
+db = RoutingSQLAlchemy()
+
+
+class InstrumentedQueuePool(QueuePool):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._stats_lock = Lock()
+        self._checkout = local()
+
+    def _inc_overflow(self):
+        with self._overflow_lock:
+            if -1 < self._max_overflow <= self._overflow:
+                return False
+
+            self._overflow += 1
+            self._checkout.overflow = self._overflow > 0
+            return True
+
+    def _do_get(self):
+        if getattr(self._checkout, "active", False):
+            return super()._do_get()
+
+        self._checkout.active = True
+        self._checkout.overflow = False
+        start = perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self._checkout.active = False
+
+        wait = perf_counter() - start
+
+        with self._stats_lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            if self._checkout.overflow:
+                self.overflow_checkouts += 1
+
+        return connection
+
+    def stats(self):
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "overflow_checkouts": self.overflow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg": self.wait_total / self.checkouts if self.checkouts else 0.0,
+            "wait_max": self.wait_max
+        }
+
+
+def engine_options(config):
+    if (config["SQLALCHEMY_DATABASE_URI"] or "").startswith("sqlite"):
+        return {}
+
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config["DATABASE_POOL_SIZE"],
+        "max_overflow": config["DATABASE_MAX_OVERFLOW"],
+        "pool_timeout": config["DATABASE_POOL_TIMEOUT"],
+        "pool_recycle": config["DATABASE_POOL_RECYCLE"],
+        "pool_pre_ping": config["DATABASE_POOL_PRE_PING"]
+    }
+
+    if config["DATABASE_STATEMENT_TIMEOUT"]:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={config['DATABASE_STATEMENT_TIMEOUT']}"
+        }
+
+    return options
+
+
+def pool_stats(engine):
+    pool = engine.pool
+
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+
+    return {"status": pool.status()}
+
+
+def dispose_engines(app: Flask):
+    for connector in get_state(app).connectors.values():
+        connector.get_engine().dispose()
 
 
 def init_app(app: Flask):
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config))
+    app.config.setdefault("SQLALCHEMY_BINDS", {}).update({
+        f"replica_{index}": uri
+        for index, uri in enumerate(app.config["DATABASE_REPLICA_URIS"])
+    })
+    app.config["DATABASE_REPLICA_BINDS"] = [
+        f"replica_{index}" for index in range(len(app.config["DATABASE_REPLICA_URIS"]))]
+    app.replica_pins = None
+
+    if app.config["DATABASE_REPLICA_BINDS"]:
+        app.replica_pins = pin_backends[app.config["DATABASE_REPLICA_PIN_BACKEND"]](app)
+
+        if app.config["DATABASE_REPLICA_PIN_BACKEND"] == "local":
+            logger.warning("replica pins are kept per worker, set "
+                           "DATABASE_REPLICA_PIN_BACKEND=redis to share them")
+
     db.init_app(app)
     app.db = db
+
+    @app.before_request
+    def reset_read_routing():
+        for key in ("read_primary", "sticky_primary", "replica_bind"):
+            g.pop(key, None)
+
+    if app.config.get("SQLALCHEMY_RECORD_QUERIES"):
+        @app.before_request
+        def start_query_count():
+            g.queries_before_request = len(get_debug_queries())
+
+        @app.after_request
+        def query_count(response):
+            queries = len(get_debug_queries()) - g.get("queries_before_request", 0)
+            response.headers["X-Query-Count"] = str(queries)
+            return response
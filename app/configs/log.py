@@ -0,0 +1,86 @@
+from flask import Flask, g, has_request_context, request
+from logging import Filter, Formatter, LogRecord, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
+from queue import SimpleQueue
+from uuid import uuid4
+import atexit
+import copy
+import json
+
+
+RECORD_ATTRIBUTES = set(vars(LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'request_id'}
+
+
+class RequestIdFilter(Filter):
+
+    def filter(self, record):
+        record.request_id = g.get('request_id') if has_request_context() else None
+        return True
+
+
+class RecordQueueHandler(QueueHandler):
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class JsonFormatter(Formatter):
+
+    def format(self, record):
+        output = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', None),
+            'message': record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES:
+                output[key] = value
+
+        if record.exc_text:
+            output['exception'] = record.exc_text
+
+        return json.dumps(output, default=str)
+
+
+def restart_listener(app: Flask):
+    app.extensions["log_listener"].start()
+
+
+def init_app(app: Flask):
+    queue = SimpleQueue()
+
+    handler = RecordQueueHandler(queue)
+    handler.addFilter(RequestIdFilter())
+
+    listener = QueueListener(queue, StreamHandler(), respect_handler_level=True)
+    listener.handlers[0].setFormatter(JsonFormatter())
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger = getLogger('app')
+    logger.handlers = [handler]
+    logger.setLevel(app.config["LOG_LEVEL"])
+    logger.propagate = False
+    app.extensions["log_listener"] = listener
+
+    @app.before_request
+    def set_request_id():
+        g.request_id = request.headers.get('X-Request-ID') or uuid4().hex
+
+    @app.after_request
+    def send_request_id(response):
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        return response
@@ -15,5 +15,6 @@ def init_app(app: Flask):
     from app.models.food_plan_model import FoodPlanModel
     from app.models.professional_rating_model import ProfessionalRatingModel
     from app.models.calendar_table import CalendarModel
+    from app.models.token_blocklist_model import TokenBlocklistModel
 
     Migrate(app, app.db)
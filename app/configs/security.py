@@ -0,0 +1,51 @@
+from flask import Flask, current_app
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
+
+
+def run_in_executor(function, *args):
+    executor = current_app.extensions.get("password_executor")
+
+    if not executor:
+        return function(*args)
+
+    return executor.submit(function, *args).result()
+
+
+def hash_password(password: str) -> str:
+    return run_in_executor(
+        generate_password_hash,
+        password,
+        current_app.config["PASSWORD_HASH_METHOD"],
+        current_app.config["PASSWORD_SALT_LENGTH"]
+    )
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    return run_in_executor(check_password_hash, password_hash, password)
+
+
+def normalize_method(method: str) -> str:
+    if not method.startswith("pbkdf2"):
+        return method
+
+    _, algorithm, iterations = (method.split(":") + [None, None])[:3]
+
+    return f"pbkdf2:{algorithm or 'sha256'}:{int(iterations or DEFAULT_PBKDF2_ITERATIONS)}"
+
+
+def needs_rehash(password_hash: str) -> bool:
+    method, salt, _ = password_hash.split("$", 2)
+
+    return (
+        normalize_method(method) != normalize_method(current_app.config["PASSWORD_HASH_METHOD"]) or
+        len(salt) != current_app.config["PASSWORD_SALT_LENGTH"]
+    )
+
+
+def init_app(app: Flask):
+    workers = app.config["PASSWORD_HASH_WORKERS"]
+
+    if workers > 0:
+        app.extensions["password_executor"] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash")
@@ -0,0 +1,8 @@
+from flask import Flask
+from app.configs import database, log, security
+
+
+def post_fork(app: Flask):
+    database.dispose_engines(app)
+    log.restart_listener(app)
+    security.init_app(app)
@@ -0,0 +1,61 @@
+from flask import Flask
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from os import makedirs, path, remove, replace
+from tempfile import NamedTemporaryFile
+
+
+class BlobStorage(ABC):
+
+    @abstractmethod
+    def save(self, data: bytes) -> str:
+        ...
+
+    @abstractmethod
+    def path(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+
+class LocalBlobStorage(BlobStorage):
+
+    def __init__(self, root: str):
+        self.root = path.abspath(root)
+        makedirs(self.root, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return path.join(self.root, key[:2], key)
+
+    def save(self, data: bytes) -> str:
+        key = sha256(data).hexdigest()
+        blob_path = self.path(key)
+
+        if path.exists(blob_path):
+            return key
+
+        makedirs(path.dirname(blob_path), exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.dirname(blob_path), delete=False) as tmp:
+            tmp.write(data)
+
+        replace(tmp.name, blob_path)
+
+        return key
+
+    def delete(self, key: str):
+        blob_path = self.path(key)
+
+        if path.exists(blob_path):
+            remove(blob_path)
+
+
+backends = {
+    "local": lambda app: LocalBlobStorage(app.config["BLOB_STORAGE_PATH"])
+}
+
+
+def init_app(app: Flask):
+    app.storage = backends[app.config["BLOB_STORAGE_BACKEND"]](app)
@@ -1,7 +1,12 @@
 from app.exceptions.food_plan_exceptions import InvalidFileError, InvalidKeyValueError, NotFoundError
-from app.exceptions.professional_exceptions import KeysNotAllowedError, TypeValueError, MissingFieldError, TypeKeyEmailError, TypeKeyPhoneError
+from app.exceptions.schedules_exceptions import FormatDateError
+from app.exceptions.pagination_exceptions import InvalidFieldsError, InvalidPageArgsError
+from flask import Response, current_app, json, request, stream_with_context
+from app.configs.auth import get_current_user
 from werkzeug.utils import secure_filename
-import re
+from werkzeug.http import quote_etag
+from hashlib import sha1
+from datetime import datetime, timedelta
 
 
 def check_pdf_extension(filename: str):
@@ -24,82 +29,142 @@ def check_user(id, model, send_type: str):
     return user
 
 
-def format_output_especific_professional(text):
-    output = text.replace('(', ' ')
-    output = output.replace(')', ' ')
-    output = output.lstrip()
+def check_current_user(model, send_type: str):
+    user = get_current_user(model.role)
 
-    return output
+    if not user:
+        raise NotFoundError(send_type)
+
+    return user
+
+
+def get_schedule_window(args):
+    start = args.get('start_date')
+    end = args.get('end_date')
+
+    try:
+        if start:
+            start = datetime.strptime(start, "%d/%m/%Y")
+        if end:
+            end = datetime.strptime(end, "%d/%m/%Y") + timedelta(days=1)
+    except ValueError:
+        raise FormatDateError
+
+    return start, end
+
+
+def get_page_arg(args, key, default=None):
+    value = args.get(key, default)
+
+    try:
+        value = int(value) if value is not None else None
+    except ValueError:
+        raise InvalidPageArgsError(key, value)
+
+    if value is not None and value < 1:
+        raise InvalidPageArgsError(key, value)
+
+    return value
+
+
+def get_fields(args, model):
+    allowed_fields = list(model.__dataclass_fields__)
+    fields = args.get('fields')
+
+    if not fields:
+        return allowed_fields
+
+    fields = [field.strip() for field in fields.split(',')]
 
+    for field in fields:
+        if field not in allowed_fields:
+            raise InvalidFieldsError(field, allowed_fields)
 
-def validate_keys_professional(data):
+    return fields
 
-    allowed_keys = [
-        'name',
-        'last_name',
-        'gender',
-        'age',
-        'specialization',
-        'description',
-        'final_rating',
-        'crm',
-        'email',
-        'password',
-        'phone',
-    ]
 
-    for key in data.keys():
-        print('%' * 80)
-        print(key)
-        print('%' * 80)
+def get_page_window(query, model, args):
+    page_size = min(
+        get_page_arg(args, 'page_size',
+                     current_app.config['DEFAULT_PAGE_SIZE']),
+        current_app.config['MAX_PAGE_SIZE']
+    )
+    cursor = get_page_arg(args, 'cursor')
 
-        if key not in allowed_keys:
-            raise KeysNotAllowedError(key)
+    if cursor:
+        query = query.filter(model.id > cursor)
 
+    return query.order_by(model.id).limit(page_size + 1), page_size
 
-def validate_type_value_professional(data):
 
-    for key, value in data.items():
-        if type(value) != str and type(value) != int:
-            raise TypeValueError(key, value)
+def paginate(query, model, args):
+    fields = get_fields(args, model)
+    query, page_size = get_page_window(query, model, args)
 
+    rows = query.with_entities(
+        model.id.label('cursor'),
+        *[getattr(model, field) for field in fields]
+    ).all()
 
-def check_all_fields_professional(data):
-    allowed_keys = [
-        'name',
-        'last_name',
-        'gender',
-        'age',
-        'specialization',
-        'description',
-        'final_rating',
-        'crm',
-        'email',
-        'password',
-        'phone',
-    ]
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = str(rows[-1].cursor)
 
-    keys = [key for key in data.keys()]
+    return [{field: getattr(row, field) for field in fields} for row in rows], next_cursor
 
-    if len(allowed_keys) > len(keys):
-        raise MissingFieldError
 
+def wants_stream():
+    return request.accept_mimetypes.best_match(
+        ['application/json', 'application/x-ndjson']) == 'application/x-ndjson'
 
-def check_type_and_format_email(data):
-    regex_email = "(\w*\@\w*\.\w*)"
 
-    if data.get('email'):
-        if type(data['email']) != str:
-            raise TypeKeyEmailError
-        if re.fullmatch(regex_email, data["email"]) == None:
-            raise TypeKeyEmailError
+def stream_query(query, model, args):
+    fields = get_fields(args, model)
 
+    rows = query.order_by(model.id).with_entities(
+        *[getattr(model, field) for field in fields]
+    ).yield_per(current_app.config['STREAM_BATCH_SIZE'])
 
-def check_type_and_format_phone(data):
-    regex_tel = "(\(\d{2}\))(\d{5}\-\d{4})"
+    def generate():
+        for row in rows:
+            yield json.dumps({field: getattr(row, field) for field in fields}) + '\n'
 
-    if data.get('phone'):
-        if type(data['phone']) != str:
-            raise TypeKeyPhoneError
-        if re.fullmatch(regex_tel, data["phone"]) == None:
-            raise TypeKeyPhoneError
+    return Response(stream_with_context(generate()), 200, mimetype='application/x-ndjson')
+
+
+def get_etag(rows):
+    return sha1(repr([tuple(row) for row in rows]).encode()).hexdigest()
+
+
+def page_etag(query, model, args):
+    query, _ = get_page_window(query, model, args)
+
+    return get_etag(query.with_entities(model.id, model.version))
+
+
+def etag_headers(etag):
+    return {'ETag': quote_etag(etag)}
+
+
+def not_modified(etag):
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=etag_headers(etag))
+
+
+def cached_response(entry):
+    response = not_modified(entry['etag'])
+
+    if response:
+        return response
+
+    return Response(entry['body'], 200, {**entry['headers'], **etag_headers(entry['etag'])},
+                    mimetype='application/json')
+
+
+def format_output_especific_professional(text):
+    output = text.replace('(', ' ')
+    output = output.replace(')', ' ')
+    output = output.lstrip()
+
+    return output
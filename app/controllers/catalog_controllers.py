@@ -0,0 +1,50 @@
+from flask import jsonify, request, current_app
+from app.models.diseases_model import DiseaseModel
+from app.models.deficiency_model import DeficiencyModel
+from app.models.surgery_model import SurgeryModel
+from app.exceptions.catalog_exceptions import CatalogNotFoundError, MissingSearchTermError
+from app.exceptions.pagination_exceptions import InvalidPageArgsError
+from app.controllers import get_page_arg
+
+
+catalogs = {
+    "diseases": DiseaseModel,
+    "deficiencies": DeficiencyModel,
+    "surgeries": SurgeryModel
+}
+
+
+def search_catalog(catalog: str):
+    try:
+        model = catalogs.get(catalog)
+
+        if not model:
+            raise CatalogNotFoundError(catalog, list(catalogs.keys()))
+
+        term = request.args.get('q', '').strip()
+
+        if not term:
+            raise MissingSearchTermError
+
+        limit = min(
+            get_page_arg(request.args, 'limit', 10),
+            current_app.config['MAX_PAGE_SIZE']
+        )
+
+    except CatalogNotFoundError as error:
+        return jsonify(error.message), 404
+    except MissingSearchTermError as error:
+        return jsonify(error.message), 400
+    except InvalidPageArgsError as error:
+        return jsonify(error.message), 400
+
+    trigram = (
+        current_app.config['CATALOG_TRIGRAM_SEARCH'] and
+        current_app.db.engine.dialect.name == 'postgresql'
+    )
+
+    return jsonify(model.search(term, limit, trigram)), 200
+
+
+def get_catalog_cache_stats():
+    return jsonify(current_app.catalog_cache.stats()), 200
@@ -1,42 +1,81 @@
-import re
 from flask import jsonify, request, current_app
-from flask_jwt_extended.utils import get_jwt_identity
 from app.models.client_model import ClientModel
 from app.models.deficiency_model import DeficiencyModel
 from app.models.surgery_model import SurgeryModel
 from app.models.diseases_model import DiseaseModel
-from app.exceptions.client_exceptions import InvalidKeysError, InvalidValueTypeError, InvalidGenderValueError, InvalidEmailError
-from app.exceptions.schedules_exceptions import FormatDateError, OutsideOfficeHoursError, ProfessionalNotFoundError, TypeDateNotAllowedError, WeekendAppointmentsError, MultipleKeysFreeSchedulesError, MissingKeyError
-from app.controllers import check_user
+from app.models.catalog_mixin import normalize_name
+from app.exceptions.schedules_exceptions import FormatDateError, InvalidSlotError, OutsideOfficeHoursError, ProfessionalNotFoundError, WeekendAppointmentsError
+from app.configs.auth import revoke_current_token
+from app.controllers.professional_controllers import invalidate_professionals
+from app.controllers import check_current_user, get_schedule_window, paginate, stream_query, wants_stream, get_etag, etag_headers, not_modified
+from app.exceptions.pagination_exceptions import InvalidFieldsError, InvalidPageArgsError
 from app.exceptions.food_plan_exceptions import NotFoundError
+from app.exceptions.login_exceptions import RoleNotAllowedError
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
-from re import S, fullmatch
+from marshmallow import ValidationError
+from app.schemas.client_schema import client_schema, client_update_schema
+from app.schemas.schedule_schema import schedule_schema
 from app.models.calendar_table import CalendarModel
 from app.models.professional_model import ProfessionalModel
-from app.exceptions.professional_exceptions import InvalidDateFormatError
-from datetime import *
+from app.models.food_plan_model import FoodPlanModel
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+def insert_catalog_items(names, model):
+    session = current_app.db.session
+
+    if current_app.db.engine.dialect.name == 'postgresql':
+        session.execute(insert(model).values([
+            {'name': name, 'normalized_name': key} for key, name in names.items()
+        ]).on_conflict_do_nothing(index_elements=['normalized_name']))
+
+        return model.find_by_names(names.values())
+
+    items = {}
+
+    while names:
+        new_items = [model(name=name) for name in names.values()]
+
+        try:
+            with session.begin_nested():
+                session.add_all(new_items)
+
+        except IntegrityError:
+            inserted = model.find_by_names(names.values())
+
+            if not inserted:
+                raise
+
+            items.update(inserted)
+            names = {key: name for key, name in names.items() if key not in items}
+            continue
+
+        items.update((item.normalized_name, item) for item in new_items)
+        break
+
+    return items
 
 
 def add_diseases_deficiencies_surgeries(items, model):
 
-    items_list = []
+    names = {}
 
     for item in items:
-        item_to_add = model.query.filter(
-            model.name.ilike(f"%{item['name']}%")).first()
+        name = item['name'].strip()
+        names.setdefault(normalize_name(name), name)
 
-        if not item_to_add:
-            item_to_add = {'name': f"{item['name']}"}
-            new_item = model(**item_to_add)
+    items_found = model.find_by_names(names.values())
 
-            current_app.db.session.add(new_item)
-            current_app.db.session.commit()
-            item_to_add = model.query.filter(
-                model.name.ilike(f"%{item['name']}%")).first()
+    missing = {key: name for key, name in names.items() if key not in items_found}
 
-        items_list.append(item_to_add)
+    if missing:
+        items_found.update(insert_catalog_items(missing, model))
 
-    return items_list
+    return [items_found[key] for key in names]
 
 
 def get_diseases_deficiencies_surgeries(data):
@@ -62,83 +101,10 @@ def get_diseases_deficiencies_surgeries(data):
     return diseases, deficiencies, surgeries
 
 
-def check_update_keys(data):
-    for key in data.keys():
-        if((key not in ClientModel.mandatory_keys) and (key not in ClientModel.optional_keys)):
-            raise InvalidKeysError(
-                list(data.keys()), ClientModel.mandatory_keys, ClientModel.optional_keys)
-
-
-def check_create_data_keys(data):
-    if (len(data) < len(ClientModel.mandatory_keys)) or (len(data) > (len(ClientModel.mandatory_keys) + len(ClientModel.optional_keys))):
-        raise InvalidKeysError(
-            list(data.keys()), ClientModel.mandatory_keys, ClientModel.optional_keys)
-
-    for key in ClientModel.mandatory_keys:
-        if key not in data.keys():
-            raise InvalidKeysError(
-                list(data.keys()), ClientModel.mandatory_keys, ClientModel.optional_keys)
-
-    check_update_keys(data)
-
-
-def check_data_values(data):
-
-    for key, value in data.items():
-        if ((
-            key == "name" or
-            key == "last_name" or
-            key == "email" or
-            key == "password" or
-            key == "gender"
-        ) and type(value) != str):
-            raise InvalidValueTypeError(data)
-
-        if((key == "height" or key == "weigth") and type(value) != float):
-            raise InvalidValueTypeError(data)
-
-        if key == "age" and type(value) != int:
-            raise InvalidValueTypeError(data)
-
-        if (key == "diseases" or key == "surgeries" or key == "deficiencies"):
-            if type(value) != list:
-                raise InvalidValueTypeError(data)
-
-            if(len(value) > 0):
-                for item in value:
-                    if(
-                        (type(item) != dict) or
-                        (len(item) != 1) or
-                        ("name" not in item.keys()) or
-                        type(item["name"]) != str
-                    ):
-                        raise InvalidValueTypeError(data)
-
-
-def check_gender(gender: str):
-    if ((gender.lower() != 'm') and (gender.lower() != 'f')):
-        raise InvalidGenderValueError
-
-
-def check_email(email: str):
-    pattern = "(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
-    is_valid = fullmatch(pattern, email)
-    if not is_valid:
-        raise InvalidEmailError
-
-
 def update():
 
-    data = request.get_json()
-    user = get_jwt_identity()
-
     try:
-        check_update_keys(data)
-        check_data_values(data)
-        if data.get("gender"):
-            check_gender(data["gender"])
-        if data.get("email"):
-            check_email(data["email"])
+        data = client_update_schema.load(request.get_json())
 
         diseases, deficiencies, surgeries = get_diseases_deficiencies_surgeries(
             data)
@@ -149,7 +115,7 @@ def update():
         if surgeries:
             data["surgeries"] = surgeries
 
-        client = check_user(user["id"], ClientModel, "client")
+        client = check_current_user(ClientModel, "client")
 
         new_password = data.get("password")
         if new_password:
@@ -159,19 +125,20 @@ def update():
         for key, value in data.items():
             setattr(client, key, value)
 
+        shown_to_professionals = data.keys() & ClientModel.__dataclass_fields__.keys()
+
         current_app.db.session.add(client)
         current_app.db.session.commit()
 
+        if shown_to_professionals and client.schedules:
+            invalidate_professionals()
+
     except NotFoundError as error:
         return jsonify(error.message), 404
-    except InvalidKeysError as error:
-        return jsonify(error.message), 400
-    except InvalidValueTypeError as error:
-        return jsonify(error.message), 400
-    except InvalidEmailError as error:
-        return jsonify(error.message), 400
-    except InvalidGenderValueError as error:
-        return jsonify(error.message), 400
+    except RoleNotAllowedError as error:
+        return jsonify(error.message), 403
+    except ValidationError as error:
+        return jsonify({"errors": error.messages}), 400
     except IntegrityError:
         return jsonify({"message": "email already exists"}), 409
 
@@ -183,13 +150,8 @@ def update():
 
 
 def create():
-    data = request.get_json()
-
     try:
-        check_create_data_keys(data)
-        check_data_values(data)
-        check_gender(data["gender"])
-        check_email(data["email"])
+        data = client_schema.load(request.get_json())
 
         diseases, deficiencies, surgeries = get_diseases_deficiencies_surgeries(
             data)
@@ -208,14 +170,8 @@ def create():
         current_app.db.session.add(client)
         current_app.db.session.commit()
 
-    except InvalidKeysError as error:
-        return jsonify(error.message), 400
-    except InvalidValueTypeError as error:
-        return jsonify(error.message), 400
-    except InvalidEmailError as error:
-        return jsonify(error.message), 400
-    except InvalidGenderValueError as error:
-        return jsonify(error.message), 400
+    except ValidationError as error:
+        return jsonify({"errors": error.messages}), 400
     except IntegrityError:
         return jsonify({"message": "email already exists"}), 409
 
@@ -225,101 +181,122 @@ def create():
 def get_client(id):
 
     try:
-        client = check_user(id, ClientModel, 'client')
+        versions = ClientModel.query.filter_by(id=id).outerjoin(
+            CalendarModel, CalendarModel.client_id == ClientModel.id
+        ).outerjoin(
+            ProfessionalModel, ProfessionalModel.id == CalendarModel.professional_id
+        ).outerjoin(
+            FoodPlanModel, FoodPlanModel.client_id == ClientModel.id
+        ).with_entities(
+            ClientModel.version,
+            CalendarModel.id,
+            CalendarModel.version,
+            ProfessionalModel.version,
+            FoodPlanModel.id
+        ).order_by(CalendarModel.id, FoodPlanModel.id).all()
+
+        if not versions:
+            raise NotFoundError('client')
 
     except NotFoundError as err:
         return jsonify(err.message), 404
 
-    return jsonify(client.serialize()), 200
+    etag = get_etag(versions)
+    response = not_modified(etag)
+
+    if response:
+        return response
+
+    client = ClientModel.query.options(*ClientModel.serialize_options()).get(id)
+
+    return jsonify(client.serialize()), 200, etag_headers(etag)
 
 
 def get_all():
-    all_clients = ClientModel.query.all()
-    return jsonify(all_clients), 200
+    try:
+        if wants_stream():
+            return stream_query(ClientModel.query, ClientModel, request.args)
+
+        all_clients, next_cursor = paginate(
+            ClientModel.query, ClientModel, request.args)
+
+    except InvalidFieldsError as error:
+        return jsonify(error.message), 400
+    except InvalidPageArgsError as error:
+        return jsonify(error.message), 400
+
+    headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+
+    return jsonify(all_clients), 200, headers
 
 
 def delete():
     try:
-        user = get_jwt_identity()
-        client = check_user(user["id"], ClientModel, "client")
+        client = check_current_user(ClientModel, "client")
+        had_schedules = bool(client.schedules)
+
         current_app.db.session.delete(client)
         current_app.db.session.commit()
+        revoke_current_token()
+
+        if had_schedules:
+            invalidate_professionals()
 
     except NotFoundError as error:
         return jsonify(error.message), 404
+    except RoleNotAllowedError as error:
+        return jsonify(error.message), 403
 
     return "", 204
 
 
 def get_schedules(id):
-    schedules = CalendarModel.query.all()
-
-    schedules_found = [
-        schedule for schedule in schedules if schedule.client_id == id]
-
-    return jsonify([{'horario': schedule_found.schedule} for schedule_found in schedules_found]), 200
-
-
-def schedule_appointment(id):
-
-    data = request.get_json()
-
     try:
-        if "schedule_date" not in data.keys():
-            raise MissingKeyError
-
-        if len(data.keys()) > 1:
-            raise MultipleKeysFreeSchedulesError
-
-    except MultipleKeysFreeSchedulesError as error:
-        return jsonify(error.message), 400
-
-    except MissingKeyError as error:
+        start, end = get_schedule_window(request.args)
+    except FormatDateError as error:
         return jsonify(error.message), 400
 
-    user = get_jwt_identity()
-
-    data['professional_id'] = id
+    schedules_found = CalendarModel.query_window(
+        start, end, client_id=id
+    ).with_entities(
+        CalendarModel.id,
+        CalendarModel.version,
+        CalendarModel.schedule
+    ).all()
 
-    data['client_id'] = user['id']
+    etag = get_etag(schedules_found)
+    response = not_modified(etag)
 
-    client = ClientModel.query.get(data['client_id'])
+    if response:
+        return response
 
-    if client.schedules:
-        schedule = CalendarModel.query.filter_by(
-            client_id=client.id).filter_by(professional_id=client.schedules[0].id).first()
+    return jsonify([{'horario': schedule_found.schedule} for schedule_found in schedules_found]), 200, etag_headers(etag)
 
-        print('-' * 50)
-        print(schedule)
 
-        current_app.db.session.delete(schedule)
+def schedule_appointment(id):
 
     try:
+        schedule_date = schedule_schema.load(
+            request.get_json())['schedule_date']
 
-        if type(data['schedule_date']) != str:
-            raise TypeDateNotAllowedError
-
-        schedule_date = data.pop('schedule_date')
-
-        try:
-            schedule_date = datetime.strptime(
-                schedule_date, "%d/%m/%Y %H:%M:%S")
-
-        except:
-            return jsonify({"error": "currect date format : dd/mm/YYYY"}), 400
-
-        if schedule_date.hour < 9 or schedule_date.hour > 17:
+        if not CalendarModel.first_slot <= schedule_date.time() <= CalendarModel.last_slot:
             raise OutsideOfficeHoursError
 
-    except TypeDateNotAllowedError as error:
-        return jsonify(error.message), 400
+    except ValidationError as error:
+        return jsonify({"errors": error.messages}), 400
 
     except OutsideOfficeHoursError as error:
         return jsonify(error.message), 200
 
-    schedules_found = CalendarModel.query.filter_by(professional_id=id).all()
+    try:
+        client = check_current_user(ClientModel, "client")
+
+    except NotFoundError as error:
+        return jsonify(error.message), 404
+    except RoleNotAllowedError as error:
+        return jsonify(error.message), 403
 
-    check_false = []
+    data = {'professional_id': id, 'client_id': client.id}
 
     try:
         professional = ProfessionalModel.query.get(id)
@@ -330,34 +307,41 @@ def schedule_appointment(id):
         if schedule_date.isoweekday() == 6 or schedule_date.isoweekday() == 7:
             raise WeekendAppointmentsError
 
+        slots = CalendarModel.slots_of_day(schedule_date)
+
+        if schedule_date not in slots:
+            raise InvalidSlotError([slot.strftime('%H:%M') for slot in slots])
+
     except WeekendAppointmentsError as error:
         return jsonify(error.message), 200
+    except InvalidSlotError as error:
+        return jsonify(error.message), 200
 
     except ProfessionalNotFoundError as error:
         return jsonify(error.message), 404
 
-    else:
-        for schedule_found in schedules_found:
+    session = current_app.db.session
 
-            check_schedule = (datetime.strptime(
-                str(schedule_found.schedule), "%Y-%m-%d %H:%M:%S"))
+    schedule = CalendarModel.query.filter_by(client_id=client.id).first()
 
-            value = schedule_date != check_schedule
+    if schedule:
+        logger.debug('replacing appointment', extra={
+            'client_id': client.id, 'schedule': schedule.schedule})
 
-            check_false.append(value)
+        session.delete(schedule)
+        session.flush()
 
-    if False in check_false:
+    data['schedule'] = schedule_date
 
-        return jsonify({'msg': 'busy schedule'}), 200
-    else:
-        data['schedule'] = schedule_date
+    schedule = CalendarModel(**data)
 
-        schedule = CalendarModel(**data)
-
-        # client.professional_id = professional.id
-        # current_app.db.session.add(client)
+    try:
+        session.add(schedule)
+        session.commit()
+        invalidate_professionals()
 
-        current_app.db.session.add(schedule)
-        current_app.db.session.commit()
+    except IntegrityError:
+        session.rollback()
+        return jsonify({'msg': 'busy schedule'}), 200
 
-        return jsonify({'msg': 'scheduled time, see you at the appointment!'}), 201
+    return jsonify({'msg': 'scheduled time, see you at the appointment!'}), 201
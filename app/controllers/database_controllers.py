@@ -0,0 +1,11 @@
+from flask import jsonify, current_app
+from app.configs.database import pool_stats
+
+
+def get_pool_stats():
+    stats = {"primary": pool_stats(current_app.db.engine)}
+
+    for bind in current_app.config["DATABASE_REPLICA_BINDS"]:
+        stats[bind] = pool_stats(current_app.db.get_engine(current_app, bind))
+
+    return jsonify(stats), 200
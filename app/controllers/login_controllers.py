@@ -1,5 +1,7 @@
-from flask import request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.configs.auth import create_user_token, get_current_user, revoke_current_token
+from app.exceptions.food_plan_exceptions import NotFoundError
 from app.exceptions.login_exceptions import EmailNotFoundError, IncorrectPasswordError, InvalidKeyError
 from app.models.client_model import ClientModel
 from app.models.professional_model import ProfessionalModel
@@ -7,10 +9,26 @@ from app.models.professional_model import ProfessionalModel
 
 @jwt_required()
 def get_user_info():
-    user = get_jwt_identity()
+    user = get_current_user()
+
+    if not user:
+        return jsonify(NotFoundError('user').message), 404
+
     return jsonify(user), 200
 
 
+@jwt_required()
+def logout():
+    revoke_current_token()
+    return "", 204
+
+
+def rehash_password(user, password):
+    if user.password_needs_rehash():
+        user.password = password
+        current_app.db.session.commit()
+
+
 def signin_client():
 
     data = request.get_json()
@@ -27,7 +45,9 @@ def signin_client():
         if not client.check_password(data['password']):
             raise IncorrectPasswordError()
 
-        access_token = create_access_token(client)
+        rehash_password(client, data['password'])
+
+        access_token = create_user_token(client)
 
     except EmailNotFoundError as error:
         return jsonify(error.message), 404
@@ -55,7 +75,9 @@ def signin_professional():
         if not professional.check_password(data['password']):
             raise IncorrectPasswordError()
 
-        access_token = create_access_token(professional)
+        rehash_password(professional, data['password'])
+
+        access_token = create_user_token(professional)
 
     except EmailNotFoundError as error:
         return jsonify(error.message), 404
@@ -1,42 +1,42 @@
-from flask import jsonify, request, current_app
-from app.exceptions.schedules_exceptions import MultipleKeysFreeSchedulesError, MissingKeyError, ProfessionalNotFoundError, ProfessionalScheduleListError, TypeDateNotAllowedError
+from flask import json, jsonify, request, current_app
+from app.exceptions.schedules_exceptions import DateRangeError, FormatDateError, MultipleKeysFreeSchedulesError, MissingKeyError, ProfessionalNotFoundError, ProfessionalScheduleListError, TypeDateNotAllowedError
 from app.models.client_model import ClientModel
 from app.models.professional_model import ProfessionalModel
-from flask_jwt_extended import get_jwt_identity
-from werkzeug.security import generate_password_hash
-from app.exceptions.professional_exceptions import NotFoundProfessionalError, KeysNotAllowedError, TypeValueError, InvalidDateFormatError, MissingFieldError, TypeKeyEmailError, TypeKeyPhoneError
+from app.configs.security import hash_password
+from app.exceptions.professional_exceptions import NotFoundProfessionalError, TypeValueError
 from app.exceptions.food_plan_exceptions import NotFoundError
+from app.exceptions.login_exceptions import RoleNotAllowedError
 from datetime import *
 import sqlalchemy
-from app.controllers import check_user, format_output_especific_professional, validate_keys_professional, validate_type_value_professional, check_all_fields_professional, check_type_and_format_email, check_type_and_format_phone
+from marshmallow import ValidationError
+from app.schemas.professional_schema import professional_schema, professional_update_schema
+from app.exceptions.pagination_exceptions import InvalidFieldsError, InvalidPageArgsError
+from app.configs.auth import revoke_current_token
+from app.configs.database import primary_reads
+from app.controllers import check_current_user, get_schedule_window, paginate, stream_query, wants_stream, format_output_especific_professional, get_etag, page_etag, etag_headers, not_modified, cached_response
 from app.models.calendar_table import CalendarModel
+from urllib.parse import urlencode
 
 
-def create():
+def invalidate_professionals():
+    current_app.professional_cache.invalidate('professional')
 
-    data = request.get_json()
-    data['final_rating'] = 0
 
-    data['final_rating'] = 0
+def create():
 
     try:
-        check_all_fields_professional(data)
-        validate_keys_professional(data)
-        validate_type_value_professional(data)
-        check_type_and_format_email(data)
-        check_type_and_format_phone(data)
+        data = professional_schema.load(request.get_json())
+        data['final_rating'] = 0
 
         session = current_app.db.session
 
-        if type(data['name']) != str:
-            raise TypeValueError('name', data['name'])
-
         password_to_hash = data.pop("password")
         professional = ProfessionalModel(**data)
         professional.password = password_to_hash
 
         session.add(professional)
         session.commit()
+        invalidate_professionals()
 
         return jsonify(professional), 200
 
@@ -45,33 +45,99 @@ def create():
         msg = errorInfo.split('Key')[1].split('.\\n')[0]
         msg = format_output_especific_professional(msg)
         return jsonify({'error': msg}), 409
-    except KeysNotAllowedError as err:
-        return jsonify(err.message), 400
+    except ValidationError as err:
+        return jsonify({'errors': err.messages}), 400
+
+
+def filter_professionals(query, args):
+    specialization = args.get('specialization')
+    min_rating = args.get('min_rating')
+
+    if specialization:
+        query = query.filter(
+            ProfessionalModel.specialization == specialization)
+
+    if min_rating:
+        try:
+            min_rating = float(min_rating)
+        except ValueError:
+            raise TypeValueError('min_rating', min_rating)
+
+        query = query.filter(ProfessionalModel.final_rating >= min_rating)
+
+    return query
+
+
+def load_page(query, args):
+    with primary_reads():
+        etag = page_etag(query, ProfessionalModel, args)
+        professional_list, next_cursor = paginate(
+            query, ProfessionalModel, args)
+
+    return {
+        'etag': etag,
+        'body': json.dumps(professional_list),
+        'headers': {'X-Next-Cursor': next_cursor} if next_cursor else {}
+    }
+
+
+def get_all():
+
+    try:
+        query = filter_professionals(ProfessionalModel.query, request.args)
+
+        if wants_stream():
+            return stream_query(query, ProfessionalModel, request.args)
+
+        entry = current_app.professional_cache.get_or_load(
+            'professional', 'list:' + urlencode(sorted(request.args.items(multi=True))),
+            lambda: load_page(query, request.args))
+
     except TypeValueError as err:
         return jsonify(err.message), 400
-    except MissingFieldError as err:
-        return jsonify(err.message), 400
-    except TypeKeyEmailError as err:
+    except InvalidFieldsError as err:
         return jsonify(err.message), 400
-    except TypeKeyPhoneError as err:
+    except InvalidPageArgsError as err:
         return jsonify(err.message), 400
 
+    return cached_response(entry)
 
-def get_all():
 
-    professional_list = ProfessionalModel.query.all()
+def load_professional(id):
+    with primary_reads():
+        versions = ProfessionalModel.query.filter_by(id=id).outerjoin(
+            CalendarModel, CalendarModel.professional_id == ProfessionalModel.id
+        ).outerjoin(
+            ClientModel, ClientModel.id == CalendarModel.client_id
+        ).with_entities(
+            ProfessionalModel.version,
+            CalendarModel.id,
+            CalendarModel.version,
+            ClientModel.version
+        ).order_by(CalendarModel.id).all()
+
+        if not versions:
+            return None
+
+        professional = ProfessionalModel.query.get(id)
 
-    return jsonify(professional_list), 200
+        return {
+            'etag': get_etag(versions),
+            'body': json.dumps(professional.serialize()),
+            'headers': {}
+        }
 
 
 def get_by_id(id):
 
     try:
-        professional = ProfessionalModel.query.filter_by(id=id).first()
+        entry = current_app.professional_cache.get_or_load(
+            'professional', f'id:{id}', lambda: load_professional(id))
 
-        if not professional:
+        if not entry:
             raise NotFoundProfessionalError
-        return jsonify(professional.serialize()), 200
+
+        return cached_response(entry)
 
     except NotFoundProfessionalError as err:
         return jsonify(err.message), 404
@@ -79,66 +145,62 @@ def get_by_id(id):
 
 def update():
 
-    data = request.get_json()
-
     try:
-        validate_keys_professional(data)
-        validate_type_value_professional(data)
+        data = professional_update_schema.load(request.get_json())
 
-        professional = get_jwt_identity()
-
-        if not professional:
-            raise NotFoundProfessionalError
+        professional = check_current_user(ProfessionalModel, "professional")
 
         if 'password' in data.keys():
             password_to_hash = data.pop('password')
-            data['password_hash'] = generate_password_hash(password_to_hash)
-
-        check_type_and_format_email(data)
-        check_type_and_format_phone(data)
+            data['password_hash'] = hash_password(password_to_hash)
 
         ProfessionalModel.query.filter_by(
-            email=professional['email']).update(data)
+            id=professional.id).update({**data, 'version': ProfessionalModel.version + 1})
 
-        # current_app.db.session.commit()
+        current_app.db.session.commit()
+        invalidate_professionals()
 
         if 'password_hash' in data.keys():
             data.pop('password_hash')
 
         return jsonify(data), 200
-    except NotFoundProfessionalError as err:
+    except sqlalchemy.exc.IntegrityError as err:
+        current_app.db.session.rollback()
+        errorInfo = str(err.orig.args)
+        msg = errorInfo.split('Key')[1].split('.\\n')[0]
+        msg = format_output_especific_professional(msg)
+        return jsonify({'error': msg}), 409
+    except NotFoundError as err:
         return jsonify(err.message), 404
-    except KeysNotAllowedError as err:
-        return jsonify(err.message), 400
-    except TypeValueError as err:
-        return jsonify(err.message), 400
-    except TypeKeyEmailError as err:
-        return jsonify(err.message), 400
-    except TypeKeyPhoneError as err:
-        return jsonify(err.message), 400
+    except RoleNotAllowedError as err:
+        return jsonify(err.message), 403
+    except ValidationError as err:
+        return jsonify({'errors': err.messages}), 400
 
 
 def delete():
 
     try:
-        user = get_jwt_identity()
-        professional = check_user(
-            user["id"], ProfessionalModel, "professional")
+        professional = check_current_user(ProfessionalModel, "professional")
 
         current_app.db.session.delete(professional)
         current_app.db.session.commit()
+        invalidate_professionals()
+        revoke_current_token()
 
     except NotFoundError as error:
         return jsonify(error.message), 404
+    except RoleNotAllowedError as error:
+        return jsonify(error.message), 403
 
     return "", 204
 
 
 def get_schedules(id):
-    schedules = CalendarModel.query.all()
-
-    schedules_found = [
-        schedule for schedule in schedules if schedule.professional_id == id]
+    try:
+        start, end = get_schedule_window(request.args)
+    except FormatDateError as error:
+        return jsonify(error.message), 400
 
     try:
         professional = ProfessionalModel.query.get(id)
@@ -150,6 +212,21 @@ def get_schedules(id):
 
         return jsonify(error.message), 404
 
+    schedules_found = CalendarModel.query_window(
+        start, end, professional_id=id
+    ).outerjoin(
+        ClientModel, ClientModel.id == CalendarModel.client_id
+    ).with_entities(
+        CalendarModel.id,
+        CalendarModel.version,
+        CalendarModel.schedule,
+        CalendarModel.client_id,
+        ClientModel.version.label('client_version'),
+        ClientModel.name,
+        ClientModel.last_name,
+        ClientModel.email
+    ).all()
+
     try:
 
         if len(schedules_found) <= 0:
@@ -158,40 +235,70 @@ def get_schedules(id):
     except ProfessionalScheduleListError as error:
         return jsonify(error.message), 200
 
+    etag = get_etag((row.id, row.version, row.client_version)
+                    for row in schedules_found)
+    response = not_modified(etag)
+
+    if response:
+        return response
+
     return jsonify([{
         'horario': schedule_found.schedule,
-        'client': ClientModel.query.get(schedule_found.client_id)} for schedule_found in schedules_found
+        'client': {
+            'id': schedule_found.client_id,
+            'name': schedule_found.name,
+            'last_name': schedule_found.last_name,
+            'email': schedule_found.email
+        } if schedule_found.client_id else None} for schedule_found in schedules_found
 
-    ]), 200
+    ]), 200, etag_headers(etag)
 
 
 def get_free_schedules(id):
 
-    free_hours = []
+    data = request.get_json()
 
-    busy_schedule = []
+    required_keys = ["schedule_date", "start_date and end_date"]
 
-    free_schedules = []
+    try:
+        if "schedule_date" in data.keys():
+            if len(data.keys()) > 1:
+                raise MultipleKeysFreeSchedulesError(required_keys)
 
-    data = request.get_json()
+            dates = {
+                'start_date': data['schedule_date'],
+                'end_date': data['schedule_date']
+            }
+        else:
+            if "start_date" not in data.keys() or "end_date" not in data.keys():
+                raise MissingKeyError(required_keys)
+
+            if len(data.keys()) > 2:
+                raise MultipleKeysFreeSchedulesError(required_keys)
+
+            dates = data
+
+        if type(dates['start_date']) != str or type(dates['end_date']) != str:
+            raise TypeDateNotAllowedError
+
+        start, end = get_schedule_window(dates)
+
+        if not start or not end:
+            raise MissingKeyError(required_keys)
+
+        if end <= start or end - start > timedelta(days=CalendarModel.max_range_days):
+            raise DateRangeError(CalendarModel.max_range_days)
 
-    try:
-        if len(data.keys()) > 1:
-            raise MultipleKeysFreeSchedulesError
     except MultipleKeysFreeSchedulesError as error:
         return jsonify(error.message), 400
-
-    try:
-        if "schedule_date" not in data.keys():
-            raise MissingKeyError
     except MissingKeyError as error:
         return jsonify(error.message), 400
-
-    try:
-        if type(data['schedule_date']) != str:
-            raise TypeDateNotAllowedError
     except TypeDateNotAllowedError as error:
         return jsonify(error.message), 400
+    except FormatDateError as error:
+        return jsonify(error.message), 400
+    except DateRangeError as error:
+        return jsonify(error.message), 400
 
     try:
         professional = ProfessionalModel.query.get(id)
@@ -201,29 +308,46 @@ def get_free_schedules(id):
     except ProfessionalNotFoundError as error:
         return jsonify(error.message), 404
 
-    try:
-        schedule_date = datetime.strptime(data['schedule_date'], "%d/%m/%Y")
-    except:
-        return jsonify({'msg': 'currect date format : dd/mm/YYYY'}), 400
+    free_schedules = CalendarModel.free_slots(id, start, end)
 
-    schedule_date = schedule_date + timedelta(hours=9)
+    return jsonify([{'horario': schedule_found} for schedule_found in free_schedules]), 200
 
-    schedules = CalendarModel.query.filter_by(professional_id=id).all()
 
-    if len(schedules) > 0:
+def search_free_schedules():
 
-        for schedule_found in schedules:
-            date = (datetime.strptime(
-                str(schedule_found.schedule), "%Y-%m-%d %H:%M:%S"))
-            busy_schedule.append(date)
+    args = request.args.to_dict()
+    args['fields'] = 'id,name,last_name,specialization,final_rating'
 
-    while schedule_date.hour < 17.15:
-        free_hours.append(schedule_date)
-        schedule_date += timedelta(minutes=45)
+    try:
+        start, end = get_schedule_window(args)
 
-    for hour in free_hours:
+        if not start or not end:
+            raise MissingKeyError(["start_date", "end_date"])
 
-        if hour not in busy_schedule:
-            free_schedules.append(hour)
+        if end <= start or end - start > timedelta(days=CalendarModel.max_range_days):
+            raise DateRangeError(CalendarModel.max_range_days)
 
-    return jsonify([{'horario': schedule_found} for schedule_found in free_schedules]), 200
+        query = filter_professionals(ProfessionalModel.query, args)
+        professional_list, next_cursor = paginate(
+            query, ProfessionalModel, args)
+
+    except MissingKeyError as error:
+        return jsonify(error.message), 400
+    except FormatDateError as error:
+        return jsonify(error.message), 400
+    except DateRangeError as error:
+        return jsonify(error.message), 400
+    except TypeValueError as error:
+        return jsonify(error.message), 400
+    except InvalidPageArgsError as error:
+        return jsonify(error.message), 400
+
+    free_schedules = CalendarModel.free_slots_by_professional(
+        [professional['id'] for professional in professional_list], start, end)
+
+    headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+
+    return jsonify([{
+        'professional': professional,
+        'horarios': free_schedules[professional['id']]} for professional in professional_list
+    ]), 200, headers
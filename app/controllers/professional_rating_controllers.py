@@ -1,56 +1,56 @@
 from flask import jsonify, current_app, request
 from app.exceptions.professional_exceptions import NotFoundProfessionalError
-from app.exceptions.rating_exceptions import AlreadyRatingError, InvalidKeyError, InvalidTypeError, InvalidValueRating
+from app.exceptions.rating_exceptions import AlreadyRatingError
 from app.models.professional_rating_model import ProfessionalRatingModel
 from app.models.professional_model import ProfessionalModel
-from flask_jwt_extended import get_jwt_identity
+from app.models.client_model import ClientModel
+from app.controllers import check_current_user
+from app.controllers.professional_controllers import invalidate_professionals
+from app.exceptions.food_plan_exceptions import NotFoundError
+from app.exceptions.login_exceptions import RoleNotAllowedError
+from sqlalchemy import Float, cast
+from marshmallow import ValidationError
+from app.schemas.rating_schema import rating_schema
 
 def set_rating(professional_id: int):
-    data = request.get_json()
-    
     try:
-        if len(data) > 1 or not 'rating' in data.keys():
-            raise InvalidKeyError(data)
-
-        if type(data['rating']) != int:
-            raise InvalidTypeError(data['rating'])
-        
-        if data['rating'] < 1 or data['rating'] > 5:
-            raise InvalidValueRating(data['rating'])
+        data = rating_schema.load(request.get_json())
 
-        client = get_jwt_identity()
+        client = check_current_user(ClientModel, 'client')
         professional = ProfessionalModel.query.get(professional_id)
         
         if not professional:
             raise NotFoundProfessionalError
         
-        verify_rating = ProfessionalRatingModel.query.filter_by(client_id=client['id']).first()
+        verify_rating = ProfessionalRatingModel.query.filter_by(client_id=client.id).first()
         
         if verify_rating:
             raise AlreadyRatingError
         
-        rating = ProfessionalRatingModel(rating = data['rating'], client_id = client['id'], professional_id = professional.id)
+        rating = ProfessionalRatingModel(rating = data['rating'], client_id = client.id, professional_id = professional.id)
 
         current_app.db.session.add(rating)
 
-        rating_output = professional.rating
+        ProfessionalModel.query.filter_by(id=professional.id).update({
+            ProfessionalModel.rating_count: ProfessionalModel.rating_count + 1,
+            ProfessionalModel.rating_sum: ProfessionalModel.rating_sum + data['rating'],
+            ProfessionalModel.final_rating: cast(
+                ProfessionalModel.rating_sum + data['rating'], Float) / (ProfessionalModel.rating_count + 1),
+            ProfessionalModel.version: ProfessionalModel.version + 1
+        }, synchronize_session=False)
 
-        average = sum([rating.rating for rating in rating_output]) / len(rating_output)
-
-        professional.final_rating = average
-
-        current_app.db.session.add(professional)
         current_app.db.session.commit()
+        invalidate_professionals()
 
     except NotFoundProfessionalError as error:
         return jsonify(error.message), 404
-    except InvalidTypeError as error:
-        return jsonify(error.message), 400
-    except InvalidKeyError as error:
-        return jsonify(error.message), 400
+    except NotFoundError as error:
+        return jsonify(error.message), 404
+    except RoleNotAllowedError as error:
+        return jsonify(error.message), 403
+    except ValidationError as error:
+        return jsonify({"errors": error.messages}), 400
     except AlreadyRatingError as error:
         return jsonify(error.message), 409
-    except InvalidValueRating as error:
-        return jsonify(error.message), 400
     
     return jsonify(rating), 200
\ No newline at end of file
@@ -0,0 +1,16 @@
+class CatalogNotFoundError(Exception):
+    def __init__(self, catalog, available: list):
+        self.message = {
+            "error": f"catalog '{catalog}' not found",
+            "available catalogs": available
+        }
+        super().__init__(self.message)
+
+
+class MissingSearchTermError(Exception):
+    def __init__(self):
+        self.message = {
+            "error": "missing a required query param",
+            "required_params": "q"
+        }
+        super().__init__(self.message)
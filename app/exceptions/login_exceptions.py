@@ -36,4 +36,13 @@ class InvalidKeyError(Exception):
                 } for key in data
             ]
         }
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class RoleNotAllowedError(Exception):
+
+
+    def __init__(self, role) -> None:
+        self.message = {
+            "message": f"Only {role} users can access this route"
+        }
+        super().__init__(self.message)
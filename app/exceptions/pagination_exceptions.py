@@ -0,0 +1,16 @@
+class InvalidFieldsError(Exception):
+    def __init__(self, field, allowed_fields: list):
+        self.message = {
+            "error": f"field '{field}' not allowed",
+            "allowed_fields": allowed_fields
+        }
+        super().__init__(self.message)
+
+
+class InvalidPageArgsError(Exception):
+    def __init__(self, key, value):
+        self.message = {
+            "error": f"{key} must be a positive integer",
+            "value sent": value
+        }
+        super().__init__(self.message)
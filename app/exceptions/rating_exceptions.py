@@ -1,45 +1,3 @@
-class InvalidTypeError(Exception):
-
-    types = {
-        str: "string",
-        int: "integer",
-        float: "float",
-        list: "list",
-        dict: "dictionary",
-        bool: "boolean"
-    }
-    
-    
-    def __init__(self, rating) -> None:
-        if type(rating) != int:
-            self.message = {
-                "available field": {
-                    "rating": "integer"
-                },
-                "field sent": {
-                    "rating": f'{self.types[type(rating)]}'
-                }
-            }
-        super().__init__(self.message)
-        
-        
-class InvalidKeyError(Exception):
-    
-    
-    def __init__(self, data) -> None:
-        self.message = {
-            "available key": {
-                "rating": "integer"
-            },
-            "key sent": [
-                {
-                    "key": key
-                } for key in data
-            ]
-        }
-        super().__init__(self.message)
-        
-        
 class AlreadyRatingError(Exception):
     
     
@@ -48,18 +6,3 @@ class AlreadyRatingError(Exception):
             "message": "Professional has already received rating from this client."
         }
         super().__init__(self.message)
-        
-        
-class InvalidValueRating(Exception):
-
-
-    def __init__(self, rating) -> None:
-        self.message = {
-            "available value in rating": {
-                "rating": "An integer between 1 to 5"
-            },
-            "value sent": {
-                "rating": rating
-            }
-        }
-        super().__init__(self.message)
\ No newline at end of file
@@ -2,19 +2,19 @@ from sqlalchemy.orm.base import EXT_CONTINUE
 
 
 class MultipleKeysFreeSchedulesError(Exception):
-    def __init__(self):
+    def __init__(self, required_keys="schedule_date"):
         self.message = {
             "error": "have more keys than necessary",
-            "required_keys": "schedule_date"
+            "required_keys": required_keys
         }
         super().__init__(self.message)
 
 
 class MissingKeyError(Exception):
-    def __init__(self):
+    def __init__(self, required_keys="schedule_date"):
         self.message = {
             "error": "missing a required key",
-            "required_keys": "schedule_date"
+            "required_keys": required_keys
         }
         super().__init__(self.message)
 
@@ -52,6 +52,15 @@ class OutsideOfficeHoursError(Exception):
         super().__init__(self.message)
 
 
+class InvalidSlotError(Exception):
+    def __init__(self, slots):
+        self.message = {
+            "message": "appointments must start at one of the schedule slots",
+            "slots": slots
+        }
+        super().__init__(self.message)
+
+
 class TypeDateNotAllowedError(Exception):
     def __init__(self):
         self.message = {
@@ -66,3 +75,11 @@ class FormatDateError(Exception):
             "error": "currect date format : dd/mm/YYYY",
         }
         super().__init__(self.message)
+
+
+class DateRangeError(Exception):
+    def __init__(self, max_days):
+        self.message = {
+            "error": f"end_date must be after start_date and at most {max_days} days ahead",
+        }
+        super().__init__(self.message)
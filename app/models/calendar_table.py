@@ -1,20 +1,79 @@
 from app.configs.database import db
-from sqlalchemy import Column, Integer, ForeignKey,DateTime
+from app.models.versioned_mixin import VersionedMixin
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, UniqueConstraint
+from datetime import date, datetime, time, timedelta
 
 
-
-class CalendarModel(db.Model):
+class CalendarModel(db.Model, VersionedMixin):
 
     __tablename__ = 'calendar'
 
+    __table_args__ = (
+        UniqueConstraint('professional_id', 'schedule',
+                         name='uq_calendar_professional_id_schedule'),
+        Index('ix_calendar_client_id_schedule', 'client_id', 'schedule'),
+    )
+
+    first_slot = time(9)
+    last_slot = time(17, 15)
+    slot_length = timedelta(minutes=45)
+    slots_per_day = (
+        datetime.combine(date.min, last_slot) - datetime.combine(date.min, first_slot)
+    ) // slot_length + 1
+    max_range_days = 31
 
     id = db.Column(db.Integer, primary_key=True)
     client_id = Column(Integer, ForeignKey('clients.id', ondelete='CASCADE'))
     professional_id = Column(Integer, ForeignKey('professional.id', ondelete='CASCADE'))
     schedule = Column(DateTime, nullable=False)
 
+    @classmethod
+    def query_window(cls, start=None, end=None, **filters):
+        query = cls.query.filter_by(**filters)
+
+        if start:
+            query = query.filter(cls.schedule >= start)
+        if end:
+            query = query.filter(cls.schedule < end)
+
+        return query.order_by(cls.schedule)
+
+    @classmethod
+    def day_slots(cls, start, end):
+        day = start.date()
+
+        while day < end.date():
+            if day.isoweekday() < 6:
+                first = datetime.combine(day, cls.first_slot)
+                for index in range(cls.slots_per_day):
+                    yield first + index * cls.slot_length
+
+            day += timedelta(days=1)
+
+    @classmethod
+    def slots_of_day(cls, moment):
+        day = datetime.combine(moment.date(), time())
+
+        return list(cls.day_slots(day, day + timedelta(days=1)))
+
+    @classmethod
+    def free_slots_by_professional(cls, professional_ids, start, end):
+        busy = {professional_id: set() for professional_id in professional_ids}
 
+        rows = cls.query_window(start, end).filter(
+            cls.professional_id.in_(professional_ids)
+        ).with_entities(cls.professional_id, cls.schedule)
 
+        for row in rows:
+            busy[row.professional_id].add(row.schedule)
 
+        slots = list(cls.day_slots(start, end))
 
+        return {
+            professional_id: [slot for slot in slots if slot not in busy_slots]
+            for professional_id, busy_slots in busy.items()
+        }
 
+    @classmethod
+    def free_slots(cls, professional_id, start, end):
+        return cls.free_slots_by_professional([professional_id], start, end)[professional_id]
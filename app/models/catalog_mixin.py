@@ -0,0 +1,90 @@
+from flask import current_app
+from sqlalchemy import Column, String, event, func, inspect
+from sqlalchemy.orm import make_transient_to_detached, validates
+from app.configs.database import db
+import unicodedata
+
+
+def normalize_name(name: str) -> str:
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+
+    return ' '.join(name.lower().split())
+
+
+class CatalogMixin:
+
+    normalized_name = Column(String(31), nullable=False, unique=True, index=True)
+
+    @validates('name')
+    def validate_name(self, key, name):
+        self.normalized_name = normalize_name(name)
+        return name
+
+    @classmethod
+    def primary_key_name(cls):
+        return inspect(cls).primary_key[0].key
+
+    @classmethod
+    def from_cache(cls, item_id, name):
+        item = cls(name=name)
+        setattr(item, cls.primary_key_name(), item_id)
+        make_transient_to_detached(item)
+
+        return db.session.merge(item, load=False)
+
+    @classmethod
+    def find_by_names(cls, names):
+        cache = current_app.catalog_cache
+        items = {}
+        missing = set()
+
+        for key in {normalize_name(name) for name in names}:
+            cached = cache.get((cls.__tablename__, key))
+
+            if cached:
+                items[key] = cls.from_cache(*cached)
+            else:
+                missing.add(key)
+
+        if missing:
+            for item in cls.query.filter(cls.normalized_name.in_(missing)):
+                cache.set((cls.__tablename__, item.normalized_name),
+                          (getattr(item, cls.primary_key_name()), item.name))
+                items[item.normalized_name] = item
+
+        return items
+
+    @classmethod
+    def search(cls, term: str, limit: int, trigram=False):
+        key = normalize_name(term)
+
+        if trigram:
+            query = cls.query.filter(cls.normalized_name.op('%')(key)).order_by(
+                func.similarity(cls.normalized_name, key).desc())
+        else:
+            query = cls.query.filter(cls.normalized_name.startswith(
+                key, autoescape=True)).order_by(cls.normalized_name)
+
+        return query.limit(limit).all()
+
+
+def invalidate_catalog_cache(mapper, connection, target):
+    current_app.catalog_cache.delete(
+        (target.__tablename__, target.normalized_name))
+
+
+def invalidate_renamed_catalog_cache(mapper, connection, target):
+    history = inspect(target).attrs.normalized_name.history
+
+    for normalized_name in history.deleted or []:
+        current_app.catalog_cache.delete(
+            (target.__tablename__, normalized_name))
+
+
+event.listen(CatalogMixin, 'after_insert',
+             invalidate_catalog_cache, propagate=True)
+event.listen(CatalogMixin, 'after_delete',
+             invalidate_catalog_cache, propagate=True)
+event.listen(CatalogMixin, 'after_update',
+             invalidate_renamed_catalog_cache, propagate=True)
@@ -1,17 +1,18 @@
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import ForeignKey
 from app.configs.database import db
+from app.models.versioned_mixin import VersionedMixin
 from dataclasses import dataclass
 from sqlalchemy import Column, Integer, String, Float
-from sqlalchemy.orm import relationship, backref
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.orm import relationship, backref, selectinload
+from app.configs.security import hash_password, verify_password, needs_rehash
 
 from app.exceptions.client_exceptions import UnauthorizedError
 from app.exceptions.schedules_exceptions import ProfessionalNotFoundError
 
 
 @dataclass
-class ClientModel(db.Model):
+class ClientModel(db.Model, VersionedMixin):
     id: int
     name: str
     last_name: str
@@ -19,10 +20,7 @@ class ClientModel(db.Model):
 
     __tablename__ = 'clients'
 
-    mandatory_keys = ["name", "last_name", "age",
-                      "email", "password", "gender", "height", "weigth"]
-    optional_keys = ["diseases", "surgeries",
-                     "deficiencies"]
+    role = 'client'
 
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
@@ -45,16 +43,29 @@ class ClientModel(db.Model):
         uselist=True
     )
 
+    @classmethod
+    def serialize_options(cls):
+        return (
+            selectinload(cls.diseases),
+            selectinload(cls.surgeries),
+            selectinload(cls.deficiencies),
+            selectinload(cls.schedules),
+            selectinload(cls.food_plan)
+        )
+
     @property
     def password(self):
         raise AttributeError('Password is not acessible.')
 
     @password.setter
     def password(self, password_to_hash):
-        self.password_hash = generate_password_hash(password_to_hash)
+        self.password_hash = hash_password(password_to_hash)
 
     def check_password(self, password_to_compare):
-        return check_password_hash(self.password_hash, password_to_compare)
+        return verify_password(self.password_hash, password_to_compare)
+
+    def password_needs_rehash(self):
+        return needs_rehash(self.password_hash)
 
     def check_professional(self, professional_id):
         if not self.schedules:
@@ -1,11 +1,12 @@
 from sqlalchemy.orm import relationship
 from app.configs.database import db
+from app.models.catalog_mixin import CatalogMixin
 from dataclasses import dataclass
 from sqlalchemy import Column, Integer, String
 
 
 @dataclass
-class DeficiencyModel(db.Model):
+class DeficiencyModel(db.Model, CatalogMixin):
 
     name: str
 
@@ -1,4 +1,5 @@
 from app.configs.database import db
+from app.models.catalog_mixin import CatalogMixin
 from sqlalchemy.orm import relationship
 
 from dataclasses import dataclass
@@ -6,7 +7,7 @@ from sqlalchemy import Column, Integer, String
 
 
 @dataclass
-class DiseaseModel(db.Model):
+class DiseaseModel(db.Model, CatalogMixin):
 
     name: str
 
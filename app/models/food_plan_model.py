@@ -1,5 +1,6 @@
 from app.configs.database import db
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.orm import deferred, load_only
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -16,10 +17,16 @@ class FoodPlanModel(db.Model):
 
     id = Column(Integer, primary_key=True)
     pdf_name = Column(String)
-    pdf = Column(LargeBinary)
+    pdf = deferred(Column(LargeBinary))
+    pdf_key = Column(String(64))
     start_time = Column(DateTime, default=datetime.utcnow())
     expiration = Column(
         DateTime, default=datetime.utcnow() + timedelta(days=90))
     client_id = Column(Integer, ForeignKey(
         'clients.id', ondelete='CASCADE'))
     professional_id = Column(Integer, nullable=False)
+
+    @classmethod
+    def summary_query(cls):
+        return cls.query.options(load_only(
+            cls.id, cls.pdf_name, cls.start_time, cls.expiration))
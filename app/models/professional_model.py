@@ -1,12 +1,13 @@
 from sqlalchemy.orm import relationship
 from app.configs.database import db
+from app.models.versioned_mixin import VersionedMixin
 from dataclasses import dataclass
 from sqlalchemy import Column, Integer, String, Float
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.configs.security import hash_password, verify_password, needs_rehash
 
 
 @dataclass
-class ProfessionalModel(db.Model):
+class ProfessionalModel(db.Model, VersionedMixin):
     id: int
     name: str
     last_name: str
@@ -18,15 +19,19 @@ class ProfessionalModel(db.Model):
 
     __tablename__ = 'professional'
 
+    role = 'professional'
+
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     gender = Column(String(1), nullable=False)
     age = Column(Integer, nullable=False)
-    specialization = Column(String(50), nullable=False)
+    specialization = Column(String(50), nullable=False, index=True)
     description = Column(String(500), nullable=False)
     crm = Column(String(15), nullable=False, unique=True)
-    final_rating = Column(Float)
+    final_rating = Column(Float, index=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default='0')
+    rating_sum = Column(Integer, nullable=False, default=0, server_default='0')
     email = Column(String, nullable=False, unique=True)
     password_hash = Column(String, nullable=False)
     phone = Column(String(15))
@@ -39,10 +44,13 @@ class ProfessionalModel(db.Model):
 
     @password.setter
     def password(self, password_to_hash):
-        self.password_hash = generate_password_hash(password_to_hash)
+        self.password_hash = hash_password(password_to_hash)
 
     def check_password(self, password_to_compare):
-        return check_password_hash(self.password_hash, password_to_compare)
+        return verify_password(self.password_hash, password_to_compare)
+
+    def password_needs_rehash(self):
+        return needs_rehash(self.password_hash)
 
     def serialize(self):
         return {
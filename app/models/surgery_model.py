@@ -1,11 +1,12 @@
 from app.configs.database import db
+from app.models.catalog_mixin import CatalogMixin
 from sqlalchemy.orm import relationship
 from dataclasses import dataclass
 from sqlalchemy import Column, Integer, String
 
 
 @dataclass
-class SurgeryModel(db.Model):
+class SurgeryModel(db.Model, CatalogMixin):
 
     name: str
 
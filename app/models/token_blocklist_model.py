@@ -0,0 +1,12 @@
+from app.configs.database import db
+from sqlalchemy import Column, String, DateTime
+
+
+class TokenBlocklistModel(db.Model):
+
+    __tablename__ = 'token_blocklist'
+
+    primary_only = True
+
+    jti = Column(String(36), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, event
+from sqlalchemy.orm import object_session
+
+
+class VersionedMixin:
+
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
+
+def increment_version(mapper, connection, target):
+    if object_session(target).is_modified(target):
+        target.version = type(target).version + 1
+
+
+event.listen(VersionedMixin, 'before_update',
+             increment_version, propagate=True)
@@ -4,6 +4,8 @@ from app.routes.professional_blueprint import bp_professional
 from app.routes.food_plan_blueprint import bp_food_plan
 from app.routes.professional_rating_blueprint import bp_professional_rating
 from app.routes.login_blueprint import bp_login
+from app.routes.catalog_blueprint import bp_catalog
+from app.routes.database_blueprint import bp_database
 
 
 def init_app(app: Flask):
@@ -12,3 +14,5 @@ def init_app(app: Flask):
     app.register_blueprint(bp_food_plan)
     app.register_blueprint(bp_professional_rating)
     app.register_blueprint(bp_login)
+    app.register_blueprint(bp_catalog)
+    app.register_blueprint(bp_database)
@@ -0,0 +1,9 @@
+from flask import Blueprint
+from flask_jwt_extended import jwt_required
+from app.controllers.catalog_controllers import search_catalog, get_catalog_cache_stats
+
+bp_catalog = Blueprint('bp_catalog', __name__, url_prefix='/catalog')
+
+
+bp_catalog.get('/<catalog>')(search_catalog)
+bp_catalog.get('/cache/stats')(jwt_required()(get_catalog_cache_stats))
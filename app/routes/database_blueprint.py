@@ -0,0 +1,8 @@
+from flask import Blueprint
+from flask_jwt_extended import jwt_required
+from app.controllers.database_controllers import get_pool_stats
+
+bp_database = Blueprint('bp_database', __name__, url_prefix='/database')
+
+
+bp_database.get('/pool/stats')(jwt_required()(get_pool_stats))
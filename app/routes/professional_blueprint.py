@@ -1,6 +1,6 @@
 from flask import Blueprint
 from flask_jwt_extended import jwt_required
-from app.controllers.professional_controllers import create, delete, get_all, get_by_id, get_schedules, get_free_schedules, update, delete
+from app.controllers.professional_controllers import create, delete, get_all, get_by_id, get_schedules, get_free_schedules, search_free_schedules, update, delete
 from app.controllers.client_controllers import schedule_appointment
 
 
@@ -10,6 +10,7 @@ bp_professional = Blueprint(
 bp_professional.post('')(create)
 bp_professional.get('')(get_all)
 bp_professional.get('/<int:id>')(jwt_required()(get_by_id))
+bp_professional.get('/free_schedules')(search_free_schedules)
 bp_professional.get('/<int:id>/schedules')(get_schedules)
 bp_professional.post('/<int:id>/free_schedules')(get_free_schedules)
 bp_professional.post('/<int:id>/schedule_appointment')(jwt_required()(schedule_appointment))
@@ -0,0 +1,15 @@
+from marshmallow import Schema, RAISE, fields
+
+
+class StrictNumber(fields.Float):
+
+    def _validated(self, value):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise self.make_error("invalid", input=value)
+        return super()._validated(value)
+
+
+class BaseSchema(Schema):
+
+    class Meta:
+        unknown = RAISE
@@ -0,0 +1,33 @@
+from marshmallow import fields, validate
+from app.schemas import BaseSchema, StrictNumber
+import re
+
+
+EMAIL_PATTERN = re.compile(r"\A[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\Z")
+GENDER_PATTERN = re.compile(r"\A[mMfF]\Z")
+
+
+class ConditionSchema(BaseSchema):
+    name = fields.String(required=True, validate=validate.Length(1, 31))
+
+
+class ClientSchema(BaseSchema):
+    name = fields.String(required=True, validate=validate.Length(1, 100))
+    last_name = fields.String(required=True, validate=validate.Length(1, 100))
+    age = fields.Integer(required=True, strict=True)
+    email = fields.String(required=True, validate=[
+        validate.Length(max=255),
+        validate.Regexp(EMAIL_PATTERN, error="Invalid Email")
+    ])
+    password = fields.String(required=True, validate=validate.Length(min=1))
+    gender = fields.String(required=True, validate=validate.Regexp(
+        GENDER_PATTERN, error="The gender value must be 'M' or 'F'"))
+    height = StrictNumber(required=True)
+    weigth = StrictNumber(required=True)
+    diseases = fields.List(fields.Nested(ConditionSchema))
+    surgeries = fields.List(fields.Nested(ConditionSchema))
+    deficiencies = fields.List(fields.Nested(ConditionSchema))
+
+
+client_schema = ClientSchema()
+client_update_schema = ClientSchema(partial=True)
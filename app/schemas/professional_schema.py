@@ -0,0 +1,26 @@
+from marshmallow import fields, validate
+from app.schemas import BaseSchema
+import re
+
+
+EMAIL_PATTERN = re.compile(r"\A\w*@\w*\.\w*\Z")
+PHONE_PATTERN = re.compile(r"\A\(\d{2}\)\d{5}-\d{4}\Z")
+
+
+class ProfessionalSchema(BaseSchema):
+    name = fields.String(required=True, validate=validate.Length(1, 100))
+    last_name = fields.String(required=True, validate=validate.Length(1, 100))
+    gender = fields.String(required=True, validate=validate.Length(equal=1))
+    age = fields.Integer(required=True, strict=True)
+    specialization = fields.String(required=True, validate=validate.Length(1, 50))
+    description = fields.String(required=True, validate=validate.Length(1, 500))
+    crm = fields.String(required=True, validate=validate.Length(1, 15))
+    email = fields.String(required=True, validate=validate.Regexp(
+        EMAIL_PATTERN, error="Email invalid! Email allowed 'example@mail.com'"))
+    password = fields.String(required=True, validate=validate.Length(min=1))
+    phone = fields.String(required=True, validate=validate.Regexp(
+        PHONE_PATTERN, error="Phone invalid! Phone allowed '(00)00000-0000'"))
+
+
+professional_schema = ProfessionalSchema()
+professional_update_schema = ProfessionalSchema(partial=True)
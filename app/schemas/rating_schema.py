@@ -0,0 +1,10 @@
+from marshmallow import fields, validate
+from app.schemas import BaseSchema
+
+
+class RatingSchema(BaseSchema):
+    rating = fields.Integer(required=True, strict=True, validate=validate.Range(
+        1, 5, error="An integer between 1 to 5"))
+
+
+rating_schema = RatingSchema()
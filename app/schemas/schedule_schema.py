@@ -0,0 +1,9 @@
+from marshmallow import fields
+from app.schemas import BaseSchema
+
+
+class ScheduleSchema(BaseSchema):
+    schedule_date = fields.DateTime(required=True, format="%d/%m/%Y %H:%M:%S")
+
+
+schedule_schema = ScheduleSchema()
@@ -0,0 +1,168 @@
+"""Throughput of the gunicorn worker modes on the read endpoints.
+
+Seeds a throwaway SQLite database, then starts gunicorn with
+gunicorn.conf.py once per mode and keeps a fixed number of keep-alive
+clients busy for a few seconds against each endpoint:
+
+    python -m benchmarks.server_benchmark
+    python -m benchmarks.server_benchmark --modes gthread gevent --concurrency 64
+
+The gevent mode needs `pip install gevent psycogreen`. The directory cache
+is disabled so every request reaches the database. Worker recycling
+(max_requests) is disabled too. A recycled gthread or gevent worker drops its
+idle keep-alive connections, and each one fails the next request sent on it.
+"""
+from argparse import ArgumentParser
+from http.client import HTTPConnection
+from os import environ, path
+from tempfile import mkdtemp
+from threading import Event, Thread
+from time import monotonic, sleep
+import subprocess
+import sys
+
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+MODES = {
+    "sync": {"GUNICORN_WORKER_CLASS": "sync", "GUNICORN_THREADS": "1"},
+    "gthread": {"GUNICORN_WORKER_CLASS": "gthread"},
+    "gevent": {"GUNICORN_WORKER_CLASS": "gevent", "GUNICORN_THREADS": "1"},
+}
+
+PATHS = [
+    "/professional?page_size=50",
+    "/professional/1/schedules",
+    "/catalog/diseases?q=a",
+]
+
+
+def seed(database_uri, professionals=200, schedules=20):
+    environ["SQLALCHEMY_DATABASE_URI"] = database_uri
+
+    from datetime import datetime, timedelta
+    from app import create_app
+    from app.models.professional_model import ProfessionalModel
+    from app.models.calendar_table import CalendarModel
+    from app.models.diseases_model import DiseaseModel
+
+    app = create_app()
+
+    with app.app_context():
+        app.db.create_all()
+        session = app.db.session
+
+        for index in range(professionals):
+            professional = ProfessionalModel(
+                name=f"Professional {index}", last_name="Benchmark", gender="M",
+                age=40, specialization="nutricionista", description="benchmark",
+                crm=f"{index:06}", email=f"professional{index}@mail.com",
+                phone="(11)99999-9999", final_rating=0, password_hash="-")
+            session.add(professional)
+            session.flush()
+
+            first = datetime(2026, 10, 19, 9)
+            session.add_all([
+                CalendarModel(professional_id=professional.id,
+                              schedule=first + timedelta(days=slot))
+                for slot in range(schedules)
+            ])
+
+        session.add_all([DiseaseModel(name=f"a{index}") for index in range(50)])
+        session.commit()
+
+
+def wait_for(port, timeout=15):
+    deadline = monotonic() + timeout
+
+    while monotonic() < deadline:
+        try:
+            connection = HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/catalog/diseases?q=a")
+            connection.getresponse().read()
+            return
+        except OSError:
+            sleep(0.2)
+
+    raise RuntimeError(f"gunicorn did not answer on port {port}")
+
+
+def load(port, url, concurrency, duration):
+    stop = Event()
+    counts = [0] * concurrency
+    errors = [0] * concurrency
+
+    def client(slot):
+        connection = HTTPConnection("127.0.0.1", port, timeout=10)
+
+        while not stop.is_set():
+            try:
+                connection.request("GET", url)
+                response = connection.getresponse()
+                response.read()
+                if response.status == 200:
+                    counts[slot] += 1
+                else:
+                    errors[slot] += 1
+            except OSError:
+                errors[slot] += 1
+                connection = HTTPConnection("127.0.0.1", port, timeout=10)
+
+    threads = [Thread(target=client, args=(slot,)) for slot in range(concurrency)]
+    [thread.start() for thread in threads]
+    sleep(duration)
+    stop.set()
+    [thread.join() for thread in threads]
+
+    return sum(counts) / duration, sum(errors)
+
+
+def run(modes, workers, threads, concurrency, duration, port=8765):
+    directory = mkdtemp()
+    database_uri = f"sqlite:///{path.join(directory, 'benchmark.sqlite')}"
+    seed(database_uri)
+
+    env = {
+        **environ,
+        "SQLALCHEMY_DATABASE_URI": database_uri,
+        "SECRET_KEY": "benchmark",
+        "JWT_SECRET_KEY": "benchmark",
+        "PORT": str(port),
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_THREADS": str(threads),
+        "GUNICORN_MAX_REQUESTS": "0",
+        "PROFESSIONAL_CACHE_TTL": "0",
+        "LOG_LEVEL": "WARNING",
+    }
+
+    print(f"{workers} workers, {threads} threads per gthread worker, "
+          f"{concurrency} clients, {duration}s per endpoint\n")
+    print(f"{'mode':<10}{'endpoint':<32}{'req/s':>10}{'errors':>8}")
+
+    for mode in modes:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:create_app()"],
+            cwd=ROOT, env={**env, **MODES[mode]},
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        try:
+            wait_for(port)
+
+            for url in PATHS:
+                throughput, errors = load(port, url, concurrency, duration)
+                print(f"{mode:<10}{url:<32}{throughput:>10.0f}{errors:>8}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    run(args.modes, args.workers, args.threads, args.concurrency, args.duration)
@@ -0,0 +1,46 @@
+"""Per-request payload validation cost.
+
+Run from the project root:
+
+    python -m benchmarks.validation_benchmark
+"""
+from timeit import Timer
+from app.schemas.client_schema import client_schema, client_update_schema
+from app.schemas.professional_schema import professional_schema
+from app.schemas.rating_schema import rating_schema
+from app.schemas.schedule_schema import schedule_schema
+
+
+payloads = {
+    "client create": (client_schema, {
+        "name": "Maria", "last_name": "Silva", "age": 30,
+        "email": "maria@mail.com", "password": "123456", "gender": "F",
+        "height": 1.65, "weigth": 60.0,
+        "diseases": [{"name": "diabetes"}, {"name": "asma"}],
+        "surgeries": [{"name": "apendicite"}],
+        "deficiencies": []
+    }),
+    "client update": (client_update_schema, {"name": "Maria", "weigth": 58.5}),
+    "client invalid": (client_schema, {
+        "name": 1, "email": "invalid", "gender": "X", "unknown": True
+    }),
+    "professional create": (professional_schema, {
+        "name": "Joao", "last_name": "Souza", "gender": "M", "age": 40,
+        "specialization": "nutricionista", "description": "Nutricionista esportivo",
+        "crm": "123456", "email": "joao@mail.com", "password": "123456",
+        "phone": "(11)99999-9999"
+    }),
+    "rating": (rating_schema, {"rating": 5}),
+    "schedule": (schedule_schema, {"schedule_date": "20/10/2026 09:00:00"}),
+}
+
+
+def run(number=20000):
+    for name, (schema, payload) in payloads.items():
+        timer = Timer(lambda: schema.validate(payload))
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        print(f"{name:<22}{best * 1e6:8.2f} us/payload")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,42 @@
+from os import getenv
+import multiprocessing
+
+
+bind = f"0.0.0.0:{getenv('PORT', '8000')}"
+
+worker_class = getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+# gunicorn silently swaps sync workers for gthread ones when threads > 1.
+threads = 1 if worker_class == "sync" else int(getenv("GUNICORN_THREADS", 4))
+worker_connections = int(getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+# gevent patches the standard library when the worker starts, so the app has
+# to be imported after that in each worker instead of once in the master.
+preload_app = getenv(
+    "GUNICORN_PRELOAD", "false" if worker_class == "gevent" else "true").lower() == "true"
+
+max_requests = int(getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+keepalive = int(getenv("GUNICORN_KEEPALIVE", 5))
+timeout = int(getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+accesslog = getenv("GUNICORN_ACCESS_LOG")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        from app.configs.server import post_fork
+
+        post_fork(server.app.wsgi())
+
+
+def post_worker_init(worker):
+    if worker.cfg.worker_class_str == "gevent":
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            worker.log.warning("psycogreen is not installed, psycopg2 calls will block the worker")
+        else:
+            patch_psycopg()
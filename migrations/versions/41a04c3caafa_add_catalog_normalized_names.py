@@ -0,0 +1,110 @@
+"""add catalog normalized names
+
+Revision ID: 41a04c3caafa
+Revises: a1bdeda11700
+Create Date: 2026-10-18 12:47:09.664021
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import unicodedata
+
+
+# revision identifiers, used by Alembic.
+revision = '41a04c3caafa'
+down_revision = 'a1bdeda11700'
+branch_labels = None
+depends_on = None
+
+
+catalogs = [
+    ('diseases', 'disease_id', 'disease_client'),
+    ('deficiencies', 'deficiency_id', 'deficiency_client'),
+    ('surgeries', 'surgery_id', 'surgery_client'),
+]
+
+
+def normalize_name(name):
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+
+    return ' '.join(name.lower().split())
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    for table_name, id_column, association_name in catalogs:
+        op.add_column(table_name, sa.Column('normalized_name', sa.String(length=31), nullable=True))
+
+        table = sa.table(
+            table_name,
+            sa.column(id_column, sa.Integer),
+            sa.column('name', sa.String),
+            sa.column('normalized_name', sa.String)
+        )
+        association = sa.table(
+            association_name,
+            sa.column('client_id', sa.Integer),
+            sa.column(id_column, sa.Integer)
+        )
+
+        kept = {}
+        rows = connection.execute(
+            sa.select(table.c[id_column], table.c.name).order_by(table.c[id_column])
+        ).all()
+
+        for row_id, name in rows:
+            key = normalize_name(name)
+
+            if key in kept:
+                connection.execute(
+                    association.delete()
+                    .where(association.c[id_column] == row_id)
+                    .where(association.c.client_id.in_(
+                        sa.select(association.c.client_id)
+                        .where(association.c[id_column] == kept[key])
+                    ))
+                )
+                connection.execute(
+                    association.update()
+                    .where(association.c[id_column] == row_id)
+                    .values({id_column: kept[key]})
+                )
+                connection.execute(table.delete().where(table.c[id_column] == row_id))
+                continue
+
+            kept[key] = row_id
+            connection.execute(
+                table.update()
+                .where(table.c[id_column] == row_id)
+                .values(normalized_name=key)
+            )
+
+        op.alter_column(table_name, 'normalized_name', existing_type=sa.String(length=31), nullable=False)
+        op.create_index(op.f(f'ix_{table_name}_normalized_name'), table_name, ['normalized_name'], unique=True)
+
+    if connection.dialect.name == 'postgresql':
+        available = connection.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).scalar()
+
+        if available:
+            op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+            for table_name, _, _ in catalogs:
+                op.create_index(
+                    f'ix_{table_name}_normalized_name_trgm', table_name, ['normalized_name'],
+                    postgresql_using='gin', postgresql_ops={'normalized_name': 'gin_trgm_ops'}
+                )
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    for table_name, _, _ in catalogs:
+        if connection.dialect.name == 'postgresql':
+            op.execute(f'DROP INDEX IF EXISTS ix_{table_name}_normalized_name_trgm')
+
+        op.drop_index(op.f(f'ix_{table_name}_normalized_name'), table_name=table_name)
+        op.drop_column(table_name, 'normalized_name')
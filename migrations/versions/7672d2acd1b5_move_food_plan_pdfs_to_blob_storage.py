@@ -0,0 +1,66 @@
+"""move food plan pdfs to blob storage
+
+Revision ID: 7672d2acd1b5
+Revises: 174f18285438
+Create Date: 2026-10-18 10:41:05.530291
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '7672d2acd1b5'
+down_revision = '174f18285438'
+branch_labels = None
+depends_on = None
+
+
+food_plan = sa.table(
+    'food_plan',
+    sa.column('id', sa.Integer),
+    sa.column('pdf', sa.LargeBinary),
+    sa.column('pdf_key', sa.String)
+)
+
+
+def upgrade():
+    op.add_column('food_plan', sa.Column('pdf_key', sa.String(length=64), nullable=True))
+
+    connection = op.get_bind()
+    storage = current_app.storage
+
+    ids = connection.execute(
+        sa.select(food_plan.c.id).where(food_plan.c.pdf.isnot(None))
+    ).scalars().all()
+
+    for food_plan_id in ids:
+        pdf = connection.execute(
+            sa.select(food_plan.c.pdf).where(food_plan.c.id == food_plan_id)
+        ).scalar()
+
+        connection.execute(
+            food_plan.update()
+            .where(food_plan.c.id == food_plan_id)
+            .values(pdf_key=storage.save(pdf), pdf=None)
+        )
+
+
+def downgrade():
+    connection = op.get_bind()
+    storage = current_app.storage
+
+    rows = connection.execute(
+        sa.select(food_plan.c.id, food_plan.c.pdf_key).where(food_plan.c.pdf_key.isnot(None))
+    ).all()
+
+    for food_plan_id, pdf_key in rows:
+        with open(storage.path(pdf_key), 'rb') as blob:
+            connection.execute(
+                food_plan.update()
+                .where(food_plan.c.id == food_plan_id)
+                .values(pdf=blob.read())
+            )
+
+    op.drop_column('food_plan', 'pdf_key')
@@ -0,0 +1,38 @@
+"""add professional rating aggregate
+
+Revision ID: a1bdeda11700
+Revises: ebedc442aee0
+Create Date: 2026-10-18 11:58:42.310774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1bdeda11700'
+down_revision = 'ebedc442aee0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('professional', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('professional', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        'UPDATE professional SET '
+        'rating_count = (SELECT COUNT(*) FROM professional_rating '
+        'WHERE professional_rating.professional_id = professional.id), '
+        'rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM professional_rating '
+        'WHERE professional_rating.professional_id = professional.id)'
+    )
+    op.execute(
+        'UPDATE professional SET final_rating = CAST(rating_sum AS FLOAT) / rating_count '
+        'WHERE rating_count > 0'
+    )
+
+
+def downgrade():
+    op.drop_column('professional', 'rating_sum')
+    op.drop_column('professional', 'rating_count')
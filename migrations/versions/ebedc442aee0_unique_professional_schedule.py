@@ -0,0 +1,30 @@
+"""unique professional schedule
+
+Revision ID: ebedc442aee0
+Revises: 7672d2acd1b5
+Create Date: 2026-10-18 11:20:14.906512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ebedc442aee0'
+down_revision = '7672d2acd1b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        'DELETE FROM calendar WHERE id NOT IN '
+        '(SELECT MIN(id) FROM calendar GROUP BY professional_id, schedule)'
+    )
+    op.drop_index('ix_calendar_professional_id_schedule', table_name='calendar')
+    op.create_unique_constraint('uq_calendar_professional_id_schedule', 'calendar', ['professional_id', 'schedule'])
+
+
+def downgrade():
+    op.drop_constraint('uq_calendar_professional_id_schedule', 'calendar', type_='unique')
+    op.create_index('ix_calendar_professional_id_schedule', 'calendar', ['professional_id', 'schedule'], unique=False)
@@ -0,0 +1,25 @@
+from pytest import fixture
+
+
+@fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'test.sqlite'}")
+    monkeypatch.setenv("SQLALCHEMY_RECORD_QUERIES", "true")
+    monkeypatch.setenv("SECRET_KEY", "test")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test")
+    monkeypatch.setenv("BLOB_STORAGE_PATH", str(tmp_path / "blobs"))
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+
+    from app import create_app
+
+    app = create_app()
+
+    with app.app_context():
+        app.db.create_all()
+        yield app
+        app.db.session.remove()
+
+
+@fixture
+def client(app):
+    return app.test_client()
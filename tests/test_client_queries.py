@@ -0,0 +1,64 @@
+from datetime import datetime
+from app.models.calendar_table import CalendarModel
+from app.models.food_plan_model import FoodPlanModel
+from app.models.professional_model import ProfessionalModel
+from pytest import mark
+
+
+# ETag versions + client + one selectinload per serialized collection
+GET_CLIENT_QUERIES = 7
+
+
+def create_client(client, items):
+    names = [{"name": f"item {index}"} for index in range(items)]
+
+    response = client.post("/clients", json={
+        "name": "Client", "last_name": "Test", "age": 30, "gender": "M",
+        "email": "client@mail.com", "password": "123", "height": 1.8,
+        "weigth": 80.0, "diseases": names, "deficiencies": names,
+        "surgeries": names})
+    assert response.status_code == 201
+    client_id = response.get_json()["id"]
+
+    response = client.post("/login/client", json={
+        "email": "client@mail.com", "password": "123"})
+
+    return client_id, response.get_json()["access_token"]
+
+
+def add_schedules_and_food_plans(app, client_id, items):
+    session = app.db.session
+    schedule = datetime(2026, 10, 19, 9)
+
+    for index in range(items):
+        professional = ProfessionalModel(
+            name=f"Professional {index}", last_name="Test", gender="M", age=40,
+            specialization="nutricionista", description="test", crm=f"{index:06}",
+            email=f"professional{index}@mail.com", phone="(11)99999-9999",
+            final_rating=0, password_hash="-")
+        session.add(professional)
+        session.flush()
+
+        session.add(CalendarModel(professional_id=professional.id,
+                                  client_id=client_id, schedule=schedule))
+        session.add(FoodPlanModel(professional_id=professional.id,
+                                  client_id=client_id, pdf_name=f"plan {index}.pdf"))
+
+    session.commit()
+
+
+@mark.parametrize("items", [1, 5])
+def test_get_client_query_count_does_not_grow_with_collections(app, client, items):
+    client_id, token = create_client(client, items)
+    add_schedules_and_food_plans(app, client_id, items)
+    app.db.session.expire_all()
+
+    response = client.get(f"/clients/{client_id}",
+                          headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body["diseases"]) == items
+    assert len(body["professional"]) == items
+    assert len(body["food_plan"]) == items
+    assert int(response.headers["X-Query-Count"]) == GET_CLIENT_QUERIES